@@ -1,23 +1,53 @@
 """Application configuration."""
 
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
+def _positive_int_env(name: str, default: int) -> int:
+    """Read a positive integer from the environment, failing with a clear message otherwise."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a positive integer, got {raw!r}") from None
+    if value < 1:
+        raise ValueError(f"{name} must be at least 1, got {value}")
+    return value
 
+
+@dataclass(frozen=True)
 class Settings:
     """Application settings."""
     # Project paths
     TEMPLATES_DIR: Path = Path(__file__).parent.parent / "templates"
     # API configuration
     API_BASE_URL: str = "/api/v1"
-    
+
     # Analytics configuration
-    PLAUSIBLE_DOMAIN: str = os.getenv("PLAUSIBLE_DOMAIN", "")
-    PLAUSIBLE_API_TOKEN: str = os.getenv("PLAUSIBLE_API_TOKEN", "")
+    PLAUSIBLE_DOMAIN: str = field(default_factory=lambda: os.environ.get("PLAUSIBLE_DOMAIN", ""))
+    PLAUSIBLE_API_TOKEN: str = field(default_factory=lambda: os.environ.get("PLAUSIBLE_API_TOKEN", ""))
+
+    # LLM concurrency (max in-flight evaluation calls per worker, each covering one answer batch)
+    EVAL_CONCURRENCY: int = field(default_factory=lambda: _positive_int_env("EVAL_CONCURRENCY", 8))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get cached application settings.
+
+    Loads environment variables from the .env file exactly once.
+
+    Returns:
+        Settings: Singleton settings instance
+    """
+    load_dotenv(override=False)
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
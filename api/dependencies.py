@@ -3,23 +3,122 @@
 This module provides dependency injection functions for FastAPI routes.
 """
 
+import asyncio
+import logging
+import os
+from collections.abc import MutableMapping
 from functools import lru_cache
-from typing import Dict, Any, Tuple
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, timezone
 
+from cachetools import LRUCache, TTLCache
 from fastapi import Request
 
 from src.storage import QuizStorage
-from src.quiz_ai import QuizAI
 
-# In-memory session storage
-_sessions: Dict[str, Any] = {}
+if TYPE_CHECKING:
+    from src.quiz_ai import QuizAI
+
+
+class ShardedDict(MutableMapping):
+    """Thread-safe dictionary split into independently locked shards.
+
+    Keys are distributed across shards by hash, so concurrent requests
+    touching different keys rarely contend on the same lock.
+    """
+
+    __slots__ = ("shards", "locks", "_mask")
+
+    def __init__(self, n: int = 16, factory: Optional[Callable[[], MutableMapping]] = None) -> None:
+        """Initialize shards.
+
+        Args:
+            n: Number of shards (rounded up to a power of two).
+            factory: Optional callable creating each shard's backing mapping
+                (e.g. a bounded cache). Defaults to a plain dict.
+        """
+        n = 1 << max(n - 1, 0).bit_length()
+        self.shards: list = [factory() if factory else {} for _ in range(n)]
+        self.locks: list = [Lock() for _ in range(n)]
+        self._mask = n - 1
+
+    def _index(self, key: Any) -> int:
+        return hash(key) & self._mask
+
+    def __getitem__(self, key: Any) -> Any:
+        i = self._index(key)
+        with self.locks[i]:
+            return self.shards[i][key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        i = self._index(key)
+        with self.locks[i]:
+            self.shards[i][key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        i = self._index(key)
+        with self.locks[i]:
+            del self.shards[i][key]
+
+    def __contains__(self, key: object) -> bool:
+        i = self._index(key)
+        with self.locks[i]:
+            return key in self.shards[i]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        i = self._index(key)
+        with self.locks[i]:
+            return self.shards[i].get(key, default)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        i = self._index(key)
+        with self.locks[i]:
+            return self.shards[i].pop(key, *default)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i, shard in enumerate(self.shards):
+            with self.locks[i]:
+                keys = list(shard)
+            yield from keys
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def expire(self) -> None:
+        """Drop expired entries from shards backed by a TTL cache."""
+        for i, shard in enumerate(self.shards):
+            if hasattr(shard, "expire"):
+                with self.locks[i]:
+                    shard.expire()
+
+
+# Session and quiz context cache bounds
+SESSION_SHARDS = 16
+SESSION_MAXSIZE = 10_000
+SESSION_TTL_SECONDS = 7200  # 2 hours
+QUIZ_CONTEXT_MAXSIZE = 1_000
+QUIZ_CONTEXT_TTL_SECONDS = 86400  # 24 hours
+LANGUAGE_PREFERENCES_MAXSIZE = 100_000
+EVICTION_INTERVAL_SECONDS = 60
+
+# In-memory session storage (expired sessions are dropped on access and by evict_expired)
+_sessions: ShardedDict = ShardedDict(
+    SESSION_SHARDS,
+    factory=lambda: TTLCache(maxsize=SESSION_MAXSIZE // SESSION_SHARDS, ttl=SESSION_TTL_SECONDS)
+)
 
 # In-memory quiz context cache (keyed by slug)
-_quiz_contexts: Dict[str, Any] = {}
+_quiz_contexts: ShardedDict = ShardedDict(
+    SESSION_SHARDS,
+    factory=lambda: TTLCache(maxsize=QUIZ_CONTEXT_MAXSIZE // SESSION_SHARDS, ttl=QUIZ_CONTEXT_TTL_SECONDS)
+)
 
-# In-memory language preferences (keyed by session_id)
-language_preferences: Dict[str, str] = {}
+# In-memory language preferences (keyed by session_id, least recently used evicted first)
+language_preferences: ShardedDict = ShardedDict(
+    SESSION_SHARDS,
+    factory=lambda: LRUCache(maxsize=LANGUAGE_PREFERENCES_MAXSIZE // SESSION_SHARDS)
+)
 
 # In-memory analytics cache (keyed by period)
 _analytics_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
@@ -36,33 +135,67 @@ def get_storage() -> QuizStorage:
 
 
 @lru_cache()
-def get_ai() -> QuizAI:
+def get_ai() -> "QuizAI":
     """Get cached AI service instance.
     
+    The agent stack is imported on first call rather than at module import.
+    
     Returns:
         QuizAI: Singleton AI service instance
     """
+    from src.quiz_ai import QuizAI
     return QuizAI()
 
 
-def get_sessions() -> Dict[str, Any]:
+def warm_up_ai() -> None:
+    """Build the AI agents and open a connection to the LLM API ahead of the first request.
+    
+    Blocking (imports the agent stack, network I/O); run it in a worker thread
+    after startup. Does nothing when no API key is configured.
+    """
+    if not os.getenv("OPENROUTER_API_KEY"):
+        return
+    try:
+        ai = get_ai()
+        for agent in (ai.generator, ai.augmenter, ai.evaluator):
+            agent.warmup()
+    except Exception as e:
+        logging.warning(f"AI warm-up failed: {type(e).__name__}: {e}")
+
+
+def get_sessions() -> ShardedDict:
     """Get in-memory sessions dictionary.
     
     Returns:
-        Dict[str, Any]: Session storage dictionary
+        ShardedDict: Session storage dictionary
     """
     return _sessions
 
 
-def get_quiz_contexts() -> Dict[str, Any]:
+def get_quiz_contexts() -> ShardedDict:
     """Get in-memory quiz contexts cache.
     
     Returns:
-        Dict[str, Any]: Quiz context cache dictionary (keyed by slug)
+        ShardedDict: Quiz context cache dictionary (keyed by slug)
     """
     return _quiz_contexts
 
 
+async def evict_expired(interval: float = EVICTION_INTERVAL_SECONDS) -> None:
+    """Periodically sweep expired sessions and quiz contexts.
+    
+    TTL caches only purge on access, so idle entries would otherwise hold
+    memory until the shard fills up. Runs until cancelled.
+    
+    Args:
+        interval: Seconds between sweeps
+    """
+    while True:
+        await asyncio.sleep(interval)
+        _sessions.expire()
+        _quiz_contexts.expire()
+
+
 def get_user_language(request: Request) -> str:
     """Get user's preferred language from session or default to 'en'."""
     session_id = request.cookies.get("session_id")
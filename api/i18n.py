@@ -1,40 +1,49 @@
 """Internationalization (i18n) utilities for translations."""
 
-import json
+import logging
+import os
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+import orjson
+
+# Supported language codes
+SUPPORTED_LANGUAGES = frozenset(["en", "hu", "de", "id", "zh", "hi", "es", "fr", "ar", "ru", "ko", "ja", "it", "rm", "ur", "bn", "th", "lo", "mn"])
 
-# Translation cache
-_translations: Dict[str, Dict[str, str]] = {}
 _translations_dir = Path(__file__).parent.parent / "translations"
 
+# Translation files keyed by language code (scanned once at import)
+_files: Dict[str, Path] = {}
+if _translations_dir.is_dir():
+    with os.scandir(_translations_dir) as entries:
+        _files = {
+            Path(entry.name).stem: Path(entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".json")
+        }
 
-def load_translations(lang: str = "en") -> Dict[str, str]:
-    """Load translations for a language."""
-    if lang in _translations:
-        return _translations[lang]
-    
-    # Validate and default to English if invalid
-    if lang not in ["en", "hu", "de", "id", "zh", "hi", "es", "fr", "ar", "ru", "ko", "ja", "it", "rm", "ur", "bn", "th", "lo", "mn"]:
-        lang = "en"
-    
-    translation_file = _translations_dir / f"{lang}.json"
-    if not translation_file.exists():
-        translation_file = _translations_dir / "en.json"
-    
-    if not translation_file.exists():
-        # Log error but don't crash - return empty dict
-        import logging
-        logging.error(f"Translation file not found: {translation_file} (translations dir: {_translations_dir})")
-        return {}
-    
-    try:
-        with open(translation_file, "r", encoding="utf-8") as f:
-            translations = json.load(f)
-            _translations[lang] = translations
-            return translations
-    except Exception as e:
-        import logging
-        logging.error(f"Error loading translation file {translation_file}: {e}")
-        return {}
 
+def _preload_translations() -> Mapping[str, Dict[str, str]]:
+    """Load every supported translation file once into a read-only mapping."""
+    loaded: Dict[str, Dict[str, str]] = {}
+    for lang in SUPPORTED_LANGUAGES:
+        translation_file = _files.get(lang)
+        if translation_file is None:
+            logging.error(f"Translation file not found: {lang}.json (translations dir: {_translations_dir})")
+            continue
+        try:
+            loaded[lang] = orjson.loads(translation_file.read_bytes())
+        except Exception as e:
+            logging.error(f"Error loading translation file {translation_file}: {e}")
+    return MappingProxyType(loaded)
+
+
+# Translation cache (immutable, shared across requests)
+_translations: Mapping[str, Dict[str, str]] = _preload_translations()
+_default_translations: Dict[str, str] = _translations.get("en", {})
+
+
+def load_translations(lang: str = "en") -> Dict[str, str]:
+    """Load translations for a language (falls back to English)."""
+    return _translations.get(lang, _default_translations)
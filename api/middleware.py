@@ -0,0 +1,114 @@
+"""ASGI middleware for the API.
+
+Route dependencies can run after FastAPI has read and parsed the request
+body, so body size limits are enforced here, before anything is buffered.
+"""
+
+from typing import Any, Callable, TypeVar
+
+from fastapi.responses import ORJSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_Endpoint = TypeVar("_Endpoint", bound=Callable[..., Any])
+
+# Methods whose requests carry a body worth resolving a per-route limit for
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
+class _PayloadTooLarge(Exception):
+    """Raised from receive once a streamed body exceeds its limit."""
+
+
+def max_body_size(max_bytes: int) -> Callable[[_Endpoint], _Endpoint]:
+    """Declare the body size limit BodySizeLimitMiddleware enforces for an endpoint.
+
+    Apply below the route decorator so the limit is set before the route is registered.
+
+    Args:
+        max_bytes: Maximum accepted body size in bytes
+
+    Returns:
+        Decorator marking the endpoint with its limit
+    """
+    def decorate(endpoint: _Endpoint) -> _Endpoint:
+        endpoint.max_body_bytes = max_bytes
+        return endpoint
+    return decorate
+
+
+class BodySizeLimitMiddleware:
+    """Reject request bodies over their route's limit before they are buffered.
+
+    The limit comes from the matched endpoint's max_body_size declaration, or
+    default_max_bytes otherwise. A declared Content-Length over the limit is
+    answered with 413 without reading the body; bodies without one (chunked)
+    are counted as they stream, and the response is replaced with 413 once
+    they exceed the limit.
+    """
+
+    def __init__(self, app: ASGIApp, default_max_bytes: int) -> None:
+        self.app = app
+        self.default_max_bytes = default_max_bytes
+
+    def _limit_for(self, scope: Scope) -> int:
+        """Body size limit of the route the request resolves to."""
+        if scope["method"] in _BODY_METHODS:
+            for route in scope["app"].router.routes:
+                match, _ = route.matches(scope)
+                if match is Match.FULL:
+                    return getattr(getattr(route, "endpoint", None), "max_body_bytes", self.default_max_bytes)
+        return self.default_max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = self._limit_for(scope)
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > max_bytes:
+                    await self._reject(scope, receive, send)
+                    return
+                break
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    exceeded = True
+                    raise _PayloadTooLarge()
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            # Whatever the app makes of the aborted read (often a 400), the client gets the 413
+            if exceeded:
+                if not response_started:
+                    response_started = True
+                    await self._reject(scope, receive, send)
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _PayloadTooLarge:
+            if response_started:
+                raise
+            response_started = True
+            await self._reject(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the 413 response."""
+        response = ORJSONResponse({"detail": "Payload too large"}, status_code=413)
+        await response(scope, receive, send)
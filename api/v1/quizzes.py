@@ -1,13 +1,18 @@
 """Quiz API endpoints with content negotiation (HTML/JSON)."""
 
 import uuid
+import random
 import asyncio
 import logging
+from dataclasses import replace
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 from datetime import datetime, timezone, date, timedelta
-from typing import Dict, List, Optional, Union, Awaitable, Any, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 
+import orjson
 from fastapi import APIRouter, Request, Depends, UploadFile, File, HTTPException, Query
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 
 try:
@@ -17,25 +22,76 @@ except ImportError:
 
 from api.config import settings
 from api.dependencies import get_storage, get_ai, get_sessions, get_quiz_contexts, get_user_language, language_preferences, get_analytics_cache
-from api.i18n import load_translations
+from api.middleware import max_body_size
+from api.i18n import SUPPORTED_LANGUAGES, load_translations
 from src.storage import QuizStorage
-from src.quiz_ai import QuizAI
 from src.parser import QuizParser
 from src.models import Question, Choice, Quiz
-from src.agents.schemas import QuizContext, LearningProfile, ResponseEvaluation, ErrorType, ErrorEvaluation, Feedback
+
+# Agent modules pull in the OpenAI client stack; import them lazily at first use
+if TYPE_CHECKING:
+    from src.quiz_ai import QuizAI
+    from src.agents.schemas import QuizContext, LearningProfile, ResponseEvaluation
 
 router = APIRouter()
-templates = Jinja2Templates(directory=str(settings.TEMPLATES_DIR))
+
+# Question count above which JSON responses are encoded off the event loop
+LARGE_PAYLOAD_QUESTIONS = 15
+
+# Bounds in-flight evaluation LLM calls (one per answer batch) across all submissions on this worker
+_evaluation_semaphore = asyncio.Semaphore(settings.EVAL_CONCURRENCY)
+
+# Serialized questions per quiz instance (dropped with the quiz; loaded quizzes are never mutated)
+_serialized_questions: "WeakKeyDictionary[Quiz, List[Dict]]" = WeakKeyDictionary()
+_serialized_questions_json: "WeakKeyDictionary[Quiz, orjson.Fragment]" = WeakKeyDictionary()
 
 # ============================================
 # Helper Functions
 # ============================================
+
 # Serialization and utility functions for API responses
 
+@lru_cache(maxsize=1)
+def get_templates() -> Jinja2Templates:
+    """Get template engine, built on the first HTML render.
+    
+    JSON-only workers never construct the Jinja2 environment. Compiled templates
+    are kept without re-checking source mtimes on every render (restart to pick
+    up template edits).
+    """
+    templates = Jinja2Templates(directory=str(settings.TEMPLATES_DIR))
+    templates.env.auto_reload = False
+    return templates
+
+
 def accepts_json(request: Request) -> bool:
-    """Check if client accepts JSON response based on Accept header."""
-    accept = request.headers.get("accept", "")
-    return "application/json" in accept
+    """Check if client accepts JSON response based on Accept header.
+    
+    The result is memoized on request.state so the header is parsed once per request.
+    """
+    cached = getattr(request.state, "accepts_json", None)
+    if cached is None:
+        cached = request.state.accepts_json = "application/json" in request.headers.get("accept", "")
+    return cached
+
+
+async def read_json(request: Request) -> Any:
+    """Read and decode the request body with orjson."""
+    return orjson.loads(await request.body())
+
+
+async def json_response(content: Dict[str, Any], question_count: int, status_code: int = 200) -> Response:
+    """Encode a JSON response with orjson, in a worker thread for payloads with many questions."""
+    if question_count > LARGE_PAYLOAD_QUESTIONS:
+        body = await asyncio.to_thread(orjson.dumps, content, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def utc_iso(dt: datetime) -> str:
+    """Format a UTC datetime as an ISO 8601 string with a 'Z' suffix."""
+    return dt.isoformat().replace('+00:00', 'Z')
 
 
 def get_template_context(request: Request, **kwargs) -> dict:
@@ -52,6 +108,59 @@ def get_template_context(request: Request, **kwargs) -> dict:
     }
 
 
+def shuffled_view(quiz: Quiz) -> Quiz:
+    """Copy a quiz with its questions in random order, leaving the original untouched.
+    
+    Each question is rebuilt around its original choices so choice order is
+    reshuffled per view as well (the source quiz may be a shared cached instance).
+    """
+    questions = [
+        Question(q.text, q.choices.copy(), q.original_choices)
+        for q in random.sample(quiz.questions, quiz.total_questions)
+    ]
+    return replace(quiz, questions=questions)
+
+
+def select_choices(question: Question, texts: List[str]) -> List[Choice]:
+    """Resolve submitted choice texts to the question's choices (in display order)."""
+    texts_set = set(texts)
+    return [c for c in question.choices if c.text in texts_set]
+
+
+def resolve_quiz_context(
+    quiz: Quiz,
+    slug: str,
+    ai: "QuizAI",
+    storage: QuizStorage,
+    quiz_contexts: Dict[str, Any],
+    extract: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Resolve a serialized quiz context from memory, then disk, then the LLM extractor.
+    
+    Blocking (file I/O and possibly an LLM call); run it off the event loop.
+    
+    Args:
+        extract: Call the extractor when no cached context exists
+    
+    Returns:
+        Optional[Dict[str, Any]]: Quiz context dict, or None if not cached and extract is False
+    """
+    if (quiz_context_dict := quiz_contexts.get(slug)) is not None:
+        return quiz_context_dict
+    
+    content_hash = storage.content_hash(quiz)
+    quiz_context_dict = storage.load_quiz_context(slug, content_hash)
+    if quiz_context_dict is None:
+        if not extract:
+            return None
+        from src.agents.tools.quiz_context_extractor import extract_quiz_context
+        quiz_context_dict = extract_quiz_context(quiz, agent=ai.evaluator).to_dict()
+        storage.save_quiz_context(slug, content_hash, quiz_context_dict)
+    
+    quiz_contexts[slug] = quiz_context_dict
+    return quiz_context_dict
+
+
 def serialize_quizzes(
     quizzes: List[Quiz], 
     quiz_contexts: Optional[Dict[str, Any]] = None
@@ -83,16 +192,35 @@ def serialize_questions(questions: List[Question]) -> List[Dict]:
         {
             "text": q.text,
             "choices": [c.text for c in q.choices],
-            "multiple": len(q.correct_choices) > 1
+            "multiple": q.is_multiple
         }
         for q in questions
     ]
 
 
+def serialize_quiz_questions(quiz: Quiz) -> List[Dict]:
+    """Serialize a quiz's questions, reusing the cached result for this quiz instance.
+    
+    The returned list is shared and must not be mutated by callers.
+    """
+    serialized = _serialized_questions.get(quiz)
+    if serialized is None:
+        serialized = _serialized_questions[quiz] = serialize_questions(quiz.questions)
+    return serialized
+
+
+def serialize_quiz_questions_json(quiz: Quiz) -> orjson.Fragment:
+    """Serialize a quiz's questions to JSON once, embeddable in orjson responses as-is."""
+    fragment = _serialized_questions_json.get(quiz)
+    if fragment is None:
+        fragment = _serialized_questions_json[quiz] = orjson.Fragment(orjson.dumps(serialize_quiz_questions(quiz)))
+    return fragment
+
+
 def serialize_response(
     questions: List[Question],
     answers: Optional[Dict[int, List[Choice]]] = None,
-    evaluations: Optional[Dict[int, ResponseEvaluation]] = None
+    evaluations: Optional[Dict[int, "ResponseEvaluation"]] = None
 ) -> Dict[int, Dict[str, Any]]:
     """Serialize user responses and evaluations for answered questions only.
     
@@ -119,13 +247,13 @@ def serialize_response(
         # Add answer data if available
         if answers and i in answers:
             selected = answers[i]
-            response_data["correct"] = set(selected) == set(q.correct_choices)
+            response_data["correct"] = q.is_correct_answer(selected)
             response_data["your_answer"] = [c.text for c in selected]
             response_data["correct_answers"] = [c.text for c in q.correct_choices]
         
         # Add evaluation data if available
         if evaluations and i in evaluations:
-            evaluation: ResponseEvaluation = evaluations[i]
+            evaluation: "ResponseEvaluation" = evaluations[i]
             if evaluation.feedback:
                 response_data["feedback"] = evaluation.feedback.to_dict()
             if evaluation.suggestions:
@@ -135,6 +263,21 @@ def serialize_response(
     
     return response
 
+def serialize_session_response(session: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """Serialize a completed session's responses, caching the result on the session.
+    
+    Answers and evaluations no longer change once a session is completed,
+    so repeated polls reuse the same serialized payload.
+    """
+    serialized = session.get("serialized_response")
+    if serialized is None:
+        serialized = session["serialized_response"] = serialize_response(
+            session["quiz"].questions,
+            answers=session.get("answers"),
+            evaluations=session.get("evaluations")
+        )
+    return serialized
+
 # ============================================
 # API Endpoints
 # ============================================
@@ -174,18 +317,17 @@ async def set_language(
             - lo: Lao
             - mn: Mongolian
     """
-    valid_languages = ["en", "hu", "de", "id", "zh", "hi", "es", "fr", "ar", "ru", "ko", "ja", "it", "rm", "ur", "bn", "th", "lo", "mn"]
-    if lang not in valid_languages:
+    if lang not in SUPPORTED_LANGUAGES:
         raise HTTPException(status_code=400, detail="Invalid language code")
     
     # Get or create session ID
     session_id = request.cookies.get("session_id")
     if not session_id:
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
     
     language_preferences[session_id] = lang
     
-    response = JSONResponse({"message": "Language set successfully", "lang": lang})
+    response = ORJSONResponse({"message": "Language set successfully", "lang": lang})
     response.set_cookie(key="session_id", value=session_id, max_age=86400 * 30)  # 30 days
     return response
 
@@ -200,15 +342,22 @@ async def set_language(
 # - DELETE /{slug}: Delete a single quiz
 # - DELETE "": Delete all quizzes
 
+# Request size limits
+UPLOAD_CHUNK_SIZE = 1 << 16  # 64 KiB
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10 MiB (quiz markdown)
+MAX_JSON_BODY_BYTES = 1024 * 1024  # 1 MiB (answers, generation options)
+MULTIPART_OVERHEAD_BYTES = 1 << 16  # Boundaries and part headers around an upload
+
 @router.post("/generate")
+@max_body_size(MAX_JSON_BODY_BYTES)
 async def generate_quiz(
     request: Request,
     storage: QuizStorage = Depends(get_storage),
-    ai: QuizAI = Depends(get_ai),
+    ai: "QuizAI" = Depends(get_ai),
 ):
     """Generate a new quiz from a natural language topic description (Workflow 1)."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         topic = (body.get("topic") or "").strip()
         complexity = body.get("complexity", "intermediate")
         style = body.get("style", "academic")
@@ -218,7 +367,8 @@ async def generate_quiz(
         if not topic:
             raise HTTPException(status_code=400, detail="Topic description is required")
 
-        quiz = ai.generate_quiz(
+        # LLM calls run in worker threads (sync OpenAI client); independent ones overlap
+        quiz = await ai.generate_quiz_async(
             topic_description=topic,
             complexity=complexity,
             style=style,
@@ -226,9 +376,9 @@ async def generate_quiz(
             question_count=question_count,
         )
 
-        storage.save_quiz(quiz)
+        await asyncio.to_thread(storage.save_quiz, quiz)
 
-        return JSONResponse({"message": f"Generated quiz '{quiz.topic}'"}, status_code=201)
+        return ORJSONResponse({"message": f"Generated quiz '{quiz.topic}'"}, status_code=201)
     except HTTPException:
         raise
     except Exception as e:
@@ -236,25 +386,25 @@ async def generate_quiz(
 
 
 @router.post("/create")
+@max_body_size(MAX_UPLOAD_BYTES)
 async def create_quiz(
     request: Request,
     storage: QuizStorage = Depends(get_storage)
 ):
     """Create quiz from pasted content."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         content = body.get("content", "")
         if not content:
             raise HTTPException(status_code=400, detail="No content provided")
         
-        quizzes = QuizParser.from_string(content)
+        quizzes = await asyncio.to_thread(QuizParser.from_string, content)
         if not quizzes:
             raise HTTPException(status_code=400, detail="No quizzes found in content")
         
-        for quiz in quizzes:
-            storage.save_quiz(quiz)
+        await asyncio.to_thread(storage.save_quizzes, quizzes)
         
-        return JSONResponse({"message": f"Created {len(quizzes)} quiz(es)"}, status_code=201)
+        return ORJSONResponse({"message": f"Created {len(quizzes)} quiz(es)"}, status_code=201)
     except HTTPException:
         raise
     except Exception as e:
@@ -262,27 +412,43 @@ async def create_quiz(
 
 
 @router.post("")
+@max_body_size(MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES)
 async def upload_quiz(
     file: UploadFile = File(...), 
     storage: QuizStorage = Depends(get_storage)
 ):
     """Upload quiz markdown file."""
     try:
-        content = await file.read()
-        quizzes = QuizParser.from_string(content.decode('utf-8'), source_file=file.filename)
+        if file.size and file.size > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="File too large")
+        
+        # Read chunks into a buffer pre-sized from the part size (grows only if the size is unknown)
+        buffer = bytearray(file.size or 0)
+        size = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            end = size + len(chunk)
+            if end > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="File too large")
+            buffer[size:end] = chunk
+            size = end
+        del buffer[size:]
+
+        quizzes = await asyncio.to_thread(QuizParser.from_bytes, buffer, file.filename)
 
         if not quizzes:
             raise HTTPException(status_code=400, detail="No quizzes found in file")
 
-        for quiz in quizzes:
-            storage.save_quiz(quiz)
+        await asyncio.to_thread(storage.save_quizzes, quizzes)
 
         return RedirectResponse(url=f"{settings.API_BASE_URL}/quizzes", status_code=303)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse quiz: {str(e)}")
 
 
 @router.put("/{slug}")
+@max_body_size(MAX_UPLOAD_BYTES)
 async def edit_quiz(
     slug: str,
     request: Request,
@@ -291,18 +457,18 @@ async def edit_quiz(
 ):
     """Update quiz content."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         content = body.get("content", "")
         if not content:
             raise HTTPException(status_code=400, detail="No content provided")
         
         # Verify quiz exists
-        existing_quiz = storage.get_quiz(slug)
+        existing_quiz = await storage.aget_quiz(slug)
         if not existing_quiz:
             raise HTTPException(status_code=404, detail="Quiz not found")
         
         # Parse new content
-        quizzes = QuizParser.from_string(content)
+        quizzes = await asyncio.to_thread(QuizParser.from_string, content)
         if not quizzes:
             raise HTTPException(status_code=400, detail="No quizzes found in content")
         
@@ -314,12 +480,13 @@ async def edit_quiz(
         
         # Update the quiz
         updated_quiz = quizzes[0]
-        storage.save_quiz(updated_quiz)
+        await asyncio.to_thread(storage.save_quiz, updated_quiz)
         
         # Invalidate cached quiz context (questions changed)
         quiz_contexts.pop(slug, None)
+        await asyncio.to_thread(storage.delete_quiz_context, slug)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "message": f"Updated quiz '{updated_quiz.topic}'",
             "slug": updated_quiz.slug
         })
@@ -330,7 +497,7 @@ async def edit_quiz(
 
 
 @router.delete("/{slug}")
-async def delete_quiz(
+def delete_quiz(
     slug: str,
     storage: QuizStorage = Depends(get_storage)
 ):
@@ -340,16 +507,16 @@ async def delete_quiz(
     if not deleted:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
-    return JSONResponse({"message": f"Quiz deleted successfully"})
+    return ORJSONResponse({"message": f"Quiz deleted successfully"})
 
 
 @router.delete("")
 async def delete_quizzes(storage: QuizStorage = Depends(get_storage)):
     """Delete all quizzes except those in examples directory."""
     try:
-        storage.delete_quizzes()
+        await asyncio.to_thread(storage.delete_quizzes)
         
-        return JSONResponse({"message": "All quizzes deleted successfully"})
+        return ORJSONResponse({"message": "All quizzes deleted successfully"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete quizzes: {str(e)}")
 
@@ -363,23 +530,26 @@ async def delete_quizzes(storage: QuizStorage = Depends(get_storage)):
 async def generate_questions(
     slug: str,
     storage: QuizStorage = Depends(get_storage),
-    ai: QuizAI = Depends(get_ai),
+    ai: "QuizAI" = Depends(get_ai),
     quiz_contexts: Dict[str, Any] = Depends(get_quiz_contexts)
 ):
     """Generate 15 more questions for the quiz."""
-    quiz = storage.get_quiz(slug)
+    quiz = await storage.aget_quiz(slug)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
     try:
-        # Get cached quiz context if available
+        # Get cached quiz context if available (memory or disk, never extracted here)
         from src.agents.schemas import QuizContext
         quiz_context = None
-        if slug in quiz_contexts:
-            quiz_context = QuizContext.from_dict(quiz_contexts[slug])
+        quiz_context_dict = await asyncio.to_thread(
+            resolve_quiz_context, quiz, slug, ai, storage, quiz_contexts, extract=False
+        )
+        if quiz_context_dict is not None:
+            quiz_context = QuizContext.from_dict(quiz_context_dict)
         
         # Generate 15 new questions based on existing ones
-        new_questions = ai.generate_questions(
+        new_questions = await ai.generate_questions_async(
             topic=quiz.topic,
             samples=quiz.questions,
             count=15,
@@ -389,22 +559,22 @@ async def generate_questions(
         if not new_questions:
             raise HTTPException(status_code=500, detail="Failed to generate questions")
 
-        # Add new questions to the quiz
-        quiz.questions.extend(new_questions)
+        # Add new questions (as a new instance; the loaded quiz is shared via the storage cache)
+        quiz = replace(quiz, questions=quiz.questions + new_questions)
 
         # Save updated quiz
-        storage.save_quiz(quiz)
+        await asyncio.to_thread(storage.save_quiz, quiz)
         
         # Invalidate cached quiz context (questions changed)
         quiz_contexts.pop(slug, None)
+        await asyncio.to_thread(storage.delete_quiz_context, slug)
 
-        return JSONResponse({
+        return ORJSONResponse({
             "message": f"Generated {len(new_questions)} new questions",
             "total_questions": len(quiz.questions),
             "new_count": len(new_questions)
         })
     except Exception as e:
-        import logging
         logging.error(f"Failed to generate questions: {type(e).__name__}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate questions: {str(e)}")
 
@@ -426,14 +596,14 @@ async def get_analytics(
 ):
     """Get analytics data from Plausible (optional feature)."""
     if not settings.PLAUSIBLE_DOMAIN or not settings.PLAUSIBLE_API_TOKEN:
-        return JSONResponse({"error": "Analytics not configured"}, status_code=404)
+        return ORJSONResponse({"error": "Analytics not configured"}, status_code=404)
     
     if httpx is None:
-        return JSONResponse({"error": "Analytics dependencies not installed"}, status_code=503)
+        return ORJSONResponse({"error": "Analytics dependencies not installed"}, status_code=503)
     
     cache_key = period or ANALYTICS_CACHE_KEY_ALL_TIME
     if cache_key in analytics_cache and datetime.now(timezone.utc) - analytics_cache[cache_key][1] < timedelta(seconds=ANALYTICS_CACHE_TTL_SECONDS):
-        return JSONResponse(analytics_cache[cache_key][0])
+        return ORJSONResponse(analytics_cache[cache_key][0])
     
     try:
         params = {
@@ -481,12 +651,12 @@ async def get_analytics(
             }
             
             analytics_cache[cache_key] = (response_data, datetime.now(timezone.utc))
-            return JSONResponse(response_data)
+            return ORJSONResponse(response_data)
     except httpx.HTTPStatusError:
-        return JSONResponse({"error": "Analytics service unavailable"}, status_code=502)
+        return ORJSONResponse({"error": "Analytics service unavailable"}, status_code=502)
     except Exception as e:
         logging.error(f"Analytics error: {e}")
-        return JSONResponse({"error": "Failed to fetch analytics"}, status_code=500)
+        return ORJSONResponse({"error": "Failed to fetch analytics"}, status_code=500)
 
 
 # ============================================
@@ -504,12 +674,12 @@ async def get_quizzes(
     quiz_contexts: Dict[str, Any] = Depends(get_quiz_contexts)
 ):
     """List all quizzes."""
-    quizzes = serialize_quizzes(storage.get_quizzes(), quiz_contexts)
+    quizzes = serialize_quizzes(await asyncio.to_thread(storage.get_quizzes), quiz_contexts)
     
     if accepts_json(request):
-        return JSONResponse({"quizzes": quizzes})
+        return ORJSONResponse({"quizzes": quizzes})
     
-    return templates.TemplateResponse("quizzes.html", get_template_context(
+    return get_templates().TemplateResponse("quizzes.html", get_template_context(
         request,
         quizzes=quizzes
     ))
@@ -522,50 +692,46 @@ async def get_quiz(
     session_id: Optional[str] = Query(None),
     storage: QuizStorage = Depends(get_storage),
     sessions: Dict[str, Any] = Depends(get_sessions),
-    ai: QuizAI = Depends(get_ai),
+    ai: "QuizAI" = Depends(get_ai),
     quiz_contexts: Dict[str, Any] = Depends(get_quiz_contexts)
 ):
     """Get quiz preview or session."""
-    quiz = storage.get_quiz(slug)
+    quiz = await storage.aget_quiz(slug)
     if not quiz:
         if accepts_json(request):
             raise HTTPException(status_code=404, detail="Quiz not found")
         return RedirectResponse(url=f"{settings.API_BASE_URL}/quizzes")
     
-    # JSON: return preview
+    # JSON: return preview (serialized once here, bypassing the response class)
     if accepts_json(request):
-        quiz.shuffle_questions()
-        return JSONResponse({
+        preview = shuffled_view(quiz)
+        return await json_response({
             "slug": quiz.slug,
             "topic": quiz.topic,
             "time_limit": quiz.time_limit,
-            "questions": serialize_questions(quiz.questions)
-        })
+            "questions": serialize_questions(preview.questions)
+        }, quiz.total_questions)
     
     # HTML: show preview or session
-    if not session_id or session_id not in sessions:
-        if slug in quiz_contexts:
-            quiz_context_dict = quiz_contexts[slug]
-        else:
-            from src.agents.tools.quiz_context_extractor import extract_quiz_context
-            quiz_context = extract_quiz_context(quiz, agent=ai.evaluator)
-            quiz_context_dict = quiz_context.to_dict()
-            quiz_contexts[slug] = quiz_context_dict
+    session = sessions.get(session_id) if session_id else None
+    if session is None:
+        quiz_context_dict = await asyncio.to_thread(
+            resolve_quiz_context, quiz, slug, ai, storage, quiz_contexts
+        )
         
-        return templates.TemplateResponse("quiz.html", get_template_context(
+        return get_templates().TemplateResponse("quiz.html", get_template_context(
             request,
             quiz={
                 "slug": quiz.slug,
                 "topic": quiz.topic,
                 "time_limit": quiz.time_limit,
-                "questions": serialize_questions(quiz.questions)
+                "questions": serialize_quiz_questions(quiz)
             },
             quiz_context=quiz_context_dict,
             status="preview"
         ))
     
     # Active session
-    session = sessions[session_id]
     session_quiz = session["quiz"]
     template_data = get_template_context(
         request,
@@ -573,11 +739,11 @@ async def get_quiz(
             "slug": session_quiz.slug,
             "topic": session_quiz.topic,
             "time_limit": session_quiz.time_limit,
-            "questions": serialize_questions(session_quiz.questions)
+            "questions": serialize_quiz_questions(session_quiz)
         },
         session_id=session_id,
         status=session["status"],
-        started_at=session["started_at"].isoformat().replace('+00:00', 'Z')
+        started_at=session["started_at_iso"]
     )
     
     if session["status"] == "in_progress" and session.get("answers"):
@@ -587,20 +753,16 @@ async def get_quiz(
         }
     
     if session["status"] == "completed":
-        template_data["response"] = serialize_response(
-            session_quiz.questions,
-            answers=session.get("answers"),
-            evaluations=session.get("evaluations")
-        )
-        template_data["submitted_at"] = session["submitted_at"].isoformat().replace('+00:00', 'Z')
+        template_data["response"] = serialize_session_response(session)
+        template_data["submitted_at"] = session["submitted_at_iso"]
         template_data["score"] = session["score"]
         template_data["total"] = session["total"]
     
-    return templates.TemplateResponse("quiz.html", template_data)
+    return get_templates().TemplateResponse("quiz.html", template_data)
 
 
 @router.get("/{slug}/content")
-async def get_quiz_content(
+def get_quiz_content(
     slug: str,
     storage: QuizStorage = Depends(get_storage)
 ):
@@ -610,7 +772,7 @@ async def get_quiz_content(
     if not content:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
-    return JSONResponse({"content": content})
+    return ORJSONResponse({"content": content})
 
 
 # ============================================
@@ -629,24 +791,27 @@ async def start_session(
     sessions: Dict[str, Any] = Depends(get_sessions)
 ):
     """Start new quiz session."""
-    quiz = storage.get_quiz(slug)
+    quiz = await storage.aget_quiz(slug)
     if not quiz:
         if accepts_json(request):
             raise HTTPException(status_code=404, detail="Quiz not found")
         return RedirectResponse(url=f"{settings.API_BASE_URL}/quizzes", status_code=303)
     
-    session_id = str(uuid.uuid4())
+    session_id = uuid.uuid4().hex
     started_at = datetime.now(timezone.utc)
-    quiz.shuffle_questions()
+    started_at_iso = utc_iso(started_at)
+    session_quiz = shuffled_view(quiz)
 
-    # Record latest session
+    # Record latest session (answers are indexed by position in the session's question order)
     sessions[session_id] = {
         "session_id": session_id,
         "slug": slug,
-        "quiz": quiz,
+        "quiz": session_quiz,
         "status": "in_progress",
         "started_at": started_at,
+        "started_at_iso": started_at_iso,
         "submitted_at": None,
+        "submitted_at_iso": None,
         "answers": {},
         "evaluations": {},
         "score": None,
@@ -655,102 +820,86 @@ async def start_session(
     }
     
     if accepts_json(request):
-        return JSONResponse({
+        return ORJSONResponse({
             "session_id": session_id,
             "slug": slug,
             "status": "in_progress",
-            "started_at": started_at.isoformat().replace('+00:00', 'Z')
+            "started_at": started_at_iso
         }, status_code=201)
     
     return RedirectResponse(url=f"{settings.API_BASE_URL}/quizzes/{slug}", status_code=303)
 
 
 @router.post("/{slug}/sessions/latest/submit")
+@max_body_size(MAX_JSON_BODY_BYTES)
 async def submit_session(
     request: Request,
     slug: str,
     session_id: str = Query(...),
-    ai: QuizAI = Depends(get_ai),
+    storage: QuizStorage = Depends(get_storage),
+    ai: "QuizAI" = Depends(get_ai),
     sessions: Dict[str, Any] = Depends(get_sessions),
     quiz_contexts: Dict[str, Any] = Depends(get_quiz_contexts)
 ):
     """Submit quiz answers for evaluation."""
-    if session_id not in sessions:
+    from src.agents.schemas import QuizContext, LearningProfile, ResponseEvaluation, ErrorType, ErrorEvaluation, Feedback
+    
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
     if session["status"] == "completed":
         raise HTTPException(status_code=400, detail="Already submitted")
     
     quiz: Quiz = session["quiz"]
-    body = await request.json()
+    body = await read_json(request)
     
     # Get or extract QuizContext
-    quiz_context: QuizContext
-    if slug in quiz_contexts:
-        quiz_context = QuizContext.from_dict(quiz_contexts[slug])
-    else:
-        from src.agents.tools.quiz_context_extractor import extract_quiz_context
-        quiz_context = extract_quiz_context(quiz, agent=ai.evaluator)
-        quiz_contexts[slug] = quiz_context.to_dict()
-    
-    learning_profile_dict = session.get("learning_profile", {})
-    learning_profile: Optional[LearningProfile] = LearningProfile.from_dict(learning_profile_dict) if learning_profile_dict else None
-    
-    # Parse answers and create evaluation tasks
-    async def evaluate_async(
-        question: Question,
-        selected: List[Choice],
-        topic: str,
-        learning_profile: Optional[LearningProfile],
-        quiz_context: QuizContext
-    ) -> Optional[ResponseEvaluation]:
-        """Evaluate a single question asynchronously."""
-        try:
-            return await asyncio.to_thread(
-                ai.evaluator.evaluate,
-                question,
-                selected,
-                topic,
-                learning_profile,
-                quiz_context
-            )
-        except Exception as e:
-            logging.error(f"Evaluation failed: {e}", exc_info=True)
-            return None
+    quiz_context: QuizContext = QuizContext.from_dict(await asyncio.to_thread(
+        resolve_quiz_context, quiz, slug, ai, storage, quiz_contexts
+    ))
+    
+    # The batch evaluator records each outcome into this profile once all batches finish
+    learning_profile: LearningProfile = LearningProfile.from_dict(session.get("learning_profile", {}))
     
+    # Parse answers
+    questions: List[Question] = quiz.questions
+    question_count = len(questions)
     answers: Dict[int, List[Choice]] = {}
-    evaluation_tasks: List[Tuple[int, Awaitable[Optional[ResponseEvaluation]]]] = []
     for idx_str, texts in body.get("answers", {}).items():
         idx = int(idx_str)
-        if idx >= len(quiz.questions) or not texts:
+        if idx >= question_count or not texts:
             continue
         
-        question: Question = quiz.questions[idx]
-        selected: List[Choice] = [c for c in question.choices if c.text in texts]
+        question: Question = questions[idx]
+        selected: List[Choice] = select_choices(question, texts)
         if selected:
             answers[idx] = selected
-            evaluation_tasks.append((
-                idx,
-                evaluate_async(question, selected, quiz.topic, learning_profile, quiz_context)
-            ))
     
-    # Execute all evaluation tasks in parallel
-    results: List[Union[Optional[ResponseEvaluation], Exception]] = await asyncio.gather(*[task for _, task in evaluation_tasks], return_exceptions=True)
+    # Evaluate answers in batched LLM calls (they share topic, profile and quiz context)
+    answered: List[int] = list(answers)
+    results: List[Optional[ResponseEvaluation]] = []
+    if answered:
+        try:
+            results = await ai.evaluator.evaluate_batch_async(
+                [questions[idx] for idx in answered],
+                [answers[idx] for idx in answered],
+                quiz.topic,
+                learning_profile,
+                quiz_context,
+                semaphore=_evaluation_semaphore
+            )
+        except Exception as e:
+            logging.error(f"Evaluation failed: {e}", exc_info=True)
     
     # Process results
     evaluation_responses: Dict[int, ResponseEvaluation] = {}
-    for (idx, _), result in zip(evaluation_tasks, results):
-        question: Question = quiz.questions[idx]
-        selected: List[Choice] = answers[idx]
-        
-        if result and not isinstance(result, Exception):
+    for idx, result in zip(answered, results):
+        if result is not None:
             evaluation_responses[idx] = result
-            if result.learning_profile:
-                learning_profile = result.learning_profile
-        else:
+    for idx in answered:
+        if idx not in evaluation_responses:
             # Fallback ResponseEvaluation
-            logging.error(f"Evaluation task failed for question {idx}: {result or 'result is None'}", exc_info=isinstance(result, Exception))
             evaluation_responses[idx] = ResponseEvaluation(
                 feedback=Feedback(concept=quiz.topic, explanation="Evaluation failed. Please try again."),
                 error_evaluation=ErrorEvaluation(error_type=ErrorType.CONCEPTUAL_MISUNDERSTANDING, confidence=0.0, reasoning="Evaluation failed"),
@@ -758,26 +907,29 @@ async def submit_session(
                 suggestions=None
             )
     
-    # Calculate score from answers
+    # Calculate score from answers (indices were bounds-checked while parsing)
     score = sum(
         1 for idx, selected in answers.items()
-        if idx < len(quiz.questions) and set(selected) == set(quiz.questions[idx].correct_choices)
+        if questions[idx].is_correct_answer(selected)
     )
     
     # Update session
+    submitted_at = datetime.now(timezone.utc)
     session.update({
         "status": "completed",
-        "submitted_at": datetime.now(timezone.utc),
+        "submitted_at": submitted_at,
+        "submitted_at_iso": utc_iso(submitted_at),
         "answers": answers,
         "evaluations": evaluation_responses,
         "score": score,
-        "learning_profile": learning_profile.to_dict() if learning_profile else {}
+        "learning_profile": learning_profile.to_dict()
     })
     
-    return JSONResponse({"score": session["score"], "total": quiz.total_questions})
+    return ORJSONResponse({"score": session["score"], "total": quiz.total_questions})
 
 
 @router.patch("/{slug}/sessions/latest")
+@max_body_size(MAX_JSON_BODY_BYTES)
 async def update_session(
     request: Request,
     slug: str,
@@ -785,25 +937,25 @@ async def update_session(
     sessions: Dict[str, Any] = Depends(get_sessions)
 ):
     """Update session data (e.g., save answers incrementally)."""
-    if session_id not in sessions:
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
     if session["status"] != "in_progress":
         raise HTTPException(status_code=400, detail="Session is not in progress")
     
     quiz: Quiz = session["quiz"]
-    body = await request.json()
+    body = await read_json(request)
     
     # Update answers if provided
     if "answers" in body:
         session["answers"] = {
-            idx: [c for c in quiz.questions[idx].choices if c.text in texts]
+            idx: select_choices(quiz.questions[idx], texts)
             for idx_str, texts in body["answers"].items()
             if (idx := int(idx_str)) < len(quiz.questions) and texts
         }
     
-    return JSONResponse({"message": "Session updated"})
+    return ORJSONResponse({"message": "Session updated"})
 
 
 @router.get("/{slug}/sessions/latest")
@@ -813,34 +965,30 @@ async def get_latest_session(
     sessions: Dict[str, Any] = Depends(get_sessions)
 ):
     """Get latest session (JSON only)."""
-    if session_id not in sessions:
+    # Retrieve latest session
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Retrieve latest session
-    session = sessions[session_id]
     quiz = session["quiz"]
     
     response = {
         "session_id": session_id,
         "slug": slug,
         "status": session["status"],
-        "started_at": session["started_at"].isoformat().replace('+00:00', 'Z'),
+        "started_at": session["started_at_iso"],
         "quiz": {
             "slug": quiz.slug,
             "topic": quiz.topic,
             "time_limit": quiz.time_limit,
-            "questions": serialize_questions(quiz.questions)
+            "questions": serialize_quiz_questions_json(quiz)
         }
     }
     
     if session["status"] == "completed":
-        response["response"] = serialize_response(
-            quiz.questions,
-            answers=session.get("answers"),
-            evaluations=session.get("evaluations")
-        )
-        response["submitted_at"] = session["submitted_at"].isoformat().replace('+00:00', 'Z')
+        response["response"] = serialize_session_response(session)
+        response["submitted_at"] = session["submitted_at_iso"]
         response["score"] = session["score"]
         response["total"] = session["total"]
     
-    return JSONResponse(response)
\ No newline at end of file
+    return await json_response(response, quiz.total_questions)
\ No newline at end of file
@@ -1,33 +1,64 @@
 """FastAPI backend for AI-powered quiz platform."""
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
 from api.config import settings
+from api.dependencies import evict_expired, warm_up_ai
+from api.middleware import BodySizeLimitMiddleware
 from api.v1 import quizzes
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the expired-entry sweeper for the lifetime of the app.
+
+    AI agents are warmed up in the background so startup is not delayed.
+    """
+    task = asyncio.create_task(evict_expired())
+    warmup = asyncio.create_task(asyncio.to_thread(warm_up_ai))
+    yield
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+    await warmup
+
+
 app = FastAPI(
     title="AI Quiz Platform",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Enforce per-route body limits (max_body_size) before anything is buffered
+app.add_middleware(BodySizeLimitMiddleware, default_max_bytes=quizzes.MAX_JSON_BODY_BYTES)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+# Static responses (immutable, shared across requests)
+_ROOT_REDIRECT = RedirectResponse(url=f"{settings.API_BASE_URL}/quizzes")
+_HEALTH_RESPONSE = ORJSONResponse({"status": "ok"})
+
+
 @app.get("/")
 async def root():
     """Redirect root to quiz listing."""
-    return RedirectResponse(url=f"{settings.API_BASE_URL}/quizzes")
+    return _ROOT_REDIRECT
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint for Fly.io."""
-    return {"status": "ok"}
+    return _HEALTH_RESPONSE
 
 
 # Include v1 routers
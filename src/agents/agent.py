@@ -1,16 +1,61 @@
 """Base agent class with common functionality for all agents."""
 
-import json
+import atexit
+import importlib.util
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Callable, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Callable, Optional
 
-from openai import OpenAI
+import orjson
+
+if TYPE_CHECKING:
+    import httpx
+    from openai import OpenAI
 
 # Constants
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 DEFAULT_MODEL = "google/gemini-2.5-flash"
 DEFAULT_TEMPERATURE = 0.7
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+# HTTP/2 multiplexes concurrent tool calls over one connection; needs the h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=1)
+def _make_http_client() -> "httpx.Client":
+    """Get the process-wide HTTP client (connection pool) used for LLM calls."""
+    import httpx
+    
+    http_client = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+        )
+    )
+    atexit.register(http_client.close)
+    return http_client
+
+
+@lru_cache(maxsize=4)
+def _make_client(api_key: str, base_url: str) -> "OpenAI":
+    """Get a shared OpenAI client for the given credentials.
+    
+    All agents reuse one client (and its connection pool) instead of
+    opening a pool and TLS sessions per agent instance. The HTTP stack is
+    imported on first use, since it dominates the import time of the agents package.
+    """
+    from openai import OpenAI
+    
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=_make_http_client()
+    )
 
 
 class Agent(ABC):
@@ -40,10 +85,23 @@ class Agent(ABC):
                 "Set it in your .env file or environment."
             )
         
-        self.client = OpenAI(api_key=api_key, base_url=OPENROUTER_BASE_URL)
+        self.client = _make_client(api_key, OPENROUTER_BASE_URL)
         self.model = model
         self.tools: List[Callable] = tools or []
     
+    def warmup(self) -> None:
+        """Open a pooled connection to the API host ahead of the first LLM call.
+        
+        Sends a HEAD request (no tokens used) so the TCP/TLS handshake is paid up
+        front; errors are ignored, the first real call simply connects itself.
+        """
+        import httpx
+        
+        try:
+            _make_http_client().head(str(self.client.base_url))
+        except httpx.HTTPError:
+            pass
+    
     def _generate(
         self,
         system_prompt: str,
@@ -90,8 +148,8 @@ class Agent(ABC):
             Parsed JSON dictionary or default value.
         """
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             return default
     
     def _plan(self, context: Dict[str, Any]) -> Dict[str, Any]:
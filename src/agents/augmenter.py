@@ -1,10 +1,12 @@
 """AugmenterAgent for autonomous quiz augmentation with additional questions."""
 
+import asyncio
 from typing import List, Optional, Callable
 
 
 from ..models import Quiz, Question
 from .agent import Agent
+from .pipeline import generate_validated_questions
 from .schemas import (
     QuizContext, TopicCoverage
 )
@@ -31,6 +33,28 @@ class AugmenterAgent(Agent):
     ) -> List[Question]:
         """Augment quiz with additional questions matching existing style.
         
+        Synchronous wrapper around augment_async; must not be called from a running event loop.
+        
+        Args:
+            quiz: The quiz to augment.
+            target_count: Number of new questions to generate.
+            quiz_context: Optional cached QuizContext. If None, will extract it.
+        """
+        return asyncio.run(self.augment_async(quiz, target_count=target_count, quiz_context=quiz_context))
+    
+    
+    async def augment_async(
+        self,
+        quiz: Quiz,
+        target_count: int = 15,
+        quiz_context: Optional[QuizContext] = None
+    ) -> List[Question]:
+        """Augment quiz with additional questions, issuing independent LLM calls concurrently.
+        
+        Context extraction and coverage analysis run in order (each depends on the previous);
+        generation is split into concurrent shards, each focused on a distinct slice of the
+        coverage gaps and validated as soon as it is generated (see generate_validated_questions).
+        
         Args:
             quiz: The quiz to augment.
             target_count: Number of new questions to generate.
@@ -38,26 +62,21 @@ class AugmenterAgent(Agent):
         """
         
         if quiz_context is None:
-            quiz_context = extract_quiz_context(quiz, agent=self)
+            quiz_context = await asyncio.to_thread(extract_quiz_context, quiz, agent=self)
         
-        topic_coverage: TopicCoverage = analyze_topic_coverage(quiz, quiz_context, agent=self, target_count=target_count)
+        topic_coverage: TopicCoverage = await asyncio.to_thread(
+            analyze_topic_coverage, quiz, quiz_context, agent=self, target_count=target_count
+        )
         
-        new_questions, _ = generate_questions(
+        validated_questions, _, _ = await generate_validated_questions(
+            self,
             topic=quiz.topic,
             samples=quiz.questions[:5], # Use first 5 as samples
             count=target_count,
             quiz_context=quiz_context,
             topic_coverage=topic_coverage,
-            agent=self,
-            suggested_time_limit=-1 # Preserve existing time limit
-        )
-        
-        validated_questions: List[Question] = validate_questions(
-            new_questions=new_questions,
             existing_questions=quiz.questions,
-            quiz_context=quiz_context,
-            agent=self
+            suggested_time_limit=-1 # Preserve existing time limit
         )
         
         return validated_questions
-
@@ -1,14 +1,20 @@
 """EvaluatorAgent for autonomous answer evaluation and feedback generation."""
 
+import asyncio
+import contextlib
+import logging
 from typing import Dict, Any, List, Optional, Callable, Union
 
 from ..models import Question, Choice
 from .agent import Agent
 from .schemas import (
-    ErrorEvaluation, PedagogicalContext, Feedback, 
+    ErrorEvaluation, ErrorType, PedagogicalContext, Feedback, 
     LearningProfile, LearningSuggestion, ResponseEvaluation, QuizContext
 )
-from .tools import evaluate_error, extract_pedagogical_context, generate_feedback, generate_suggestions
+from .tools import evaluate_error, extract_pedagogical_context, generate_feedback, generate_suggestions, evaluate_responses
+
+# Answers per batched evaluation call (keeps each response well under the output token limit)
+EVALUATION_BATCH_SIZE = 8
 
 
 class EvaluatorAgent(Agent):
@@ -19,7 +25,7 @@ class EvaluatorAgent(Agent):
         model: str = "google/gemini-2.5-flash",
         tools: Optional[List[Callable]] = None
     ) -> None:
-        default_tools = [evaluate_error, extract_pedagogical_context, generate_feedback, generate_suggestions]
+        default_tools = [evaluate_error, extract_pedagogical_context, generate_feedback, generate_suggestions, evaluate_responses]
         super().__init__(model, tools=tools or default_tools)
     
     
@@ -33,6 +39,34 @@ class EvaluatorAgent(Agent):
     ) -> ResponseEvaluation:
         """Evaluate answer and generate adaptive feedback.
         
+        Synchronous wrapper around evaluate_async; must not be called from a running event loop.
+        
+        Args:
+            question: The question being answered.
+            selected: User's selected choices.
+            topic: Topic of the quiz.
+            learning_profile: Optional learning profile for personalized feedback.
+            quiz_context: Optional quiz context (style, complexity, language, etc.) to adapt suggestions.
+        
+        Returns:
+            ResponseEvaluation with feedback, error evaluation, and suggestions.
+        """
+        return asyncio.run(self.evaluate_async(question, selected, topic, learning_profile, quiz_context))
+    
+    
+    async def evaluate_async(
+        self,
+        question: Question,
+        selected: List[Choice],
+        topic: str = "general",
+        learning_profile: Optional[Union[LearningProfile, Dict[str, Any]]] = None,
+        quiz_context: Optional[QuizContext] = None
+    ) -> ResponseEvaluation:
+        """Evaluate answer, issuing the independent feedback and suggestion calls concurrently.
+        
+        Error evaluation and pedagogical context run in order (each depends on the previous);
+        feedback and suggestions only consume their results, so they run side by side.
+        
         Args:
             question: The question being answered.
             selected: User's selected choices.
@@ -48,15 +82,150 @@ class EvaluatorAgent(Agent):
         elif isinstance(learning_profile, dict):
             learning_profile = LearningProfile.from_dict(learning_profile)
         
-        error_evaluation: ErrorEvaluation = evaluate_error(question, selected, agent=self)
+        # Exact matches are classified locally, without the LLM call or a worker thread
+        if question.is_correct_answer(selected):
+            error_evaluation = ErrorEvaluation(error_type=ErrorType.CORRECT, confidence=1.0, reasoning="Exact match")
+        else:
+            error_evaluation = await asyncio.to_thread(evaluate_error, question, selected, agent=self)
         
-        pedagogical_context: PedagogicalContext = extract_pedagogical_context(question, error_evaluation, topic, learning_profile, agent=self)
+        pedagogical_context: PedagogicalContext = await asyncio.to_thread(
+            extract_pedagogical_context, question, error_evaluation, topic, learning_profile, agent=self
+        )
         
-        feedback: Feedback = generate_feedback(question, selected, error_evaluation, pedagogical_context, agent=self, quiz_context=quiz_context)
+        # Feedback does not read the learning profile, which generate_suggestions updates in place
+        feedback, suggestions = await asyncio.gather(
+            asyncio.to_thread(
+                generate_feedback, question, selected, error_evaluation, pedagogical_context, agent=self, quiz_context=quiz_context
+            ),
+            asyncio.to_thread(
+                generate_suggestions, question, error_evaluation, topic, learning_profile, pedagogical_context, agent=self, quiz_context=quiz_context
+            )
+        )
         
-        suggestions: List[LearningSuggestion] = generate_suggestions(
-            question, error_evaluation, topic, learning_profile, pedagogical_context, agent=self, quiz_context=quiz_context
+        return ResponseEvaluation(
+            feedback=feedback,
+            error_evaluation=error_evaluation,
+            learning_profile=learning_profile,
+            suggestions=suggestions if suggestions else None
         )
+    
+    
+    def evaluate_batch(
+        self,
+        questions: List[Question],
+        selections: List[List[Choice]],
+        topic: str = "general",
+        learning_profile: Optional[Union[LearningProfile, Dict[str, Any]]] = None,
+        quiz_context: Optional[QuizContext] = None
+    ) -> List[Optional[ResponseEvaluation]]:
+        """Evaluate several answers of one quiz with batched LLM calls.
+        
+        Synchronous wrapper around evaluate_batch_async; must not be called from a running event loop.
+        
+        Args:
+            questions: The questions being answered.
+            selections: User's selected choices, aligned with questions.
+            topic: Topic of the quiz.
+            learning_profile: Optional learning profile (updated in place with every evaluated outcome).
+            quiz_context: Optional quiz context (style, complexity, language, etc.) to adapt feedback.
+        
+        Returns:
+            One ResponseEvaluation per question in input order (None where it was not evaluated).
+        """
+        return asyncio.run(self.evaluate_batch_async(questions, selections, topic, learning_profile, quiz_context))
+    
+    
+    async def evaluate_batch_async(
+        self,
+        questions: List[Question],
+        selections: List[List[Choice]],
+        topic: str = "general",
+        learning_profile: Optional[Union[LearningProfile, Dict[str, Any]]] = None,
+        quiz_context: Optional[QuizContext] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[Optional[ResponseEvaluation]]:
+        """Evaluate several answers of one quiz, EVALUATION_BATCH_SIZE answers per LLM call.
+        
+        Batches are issued concurrently; re-raises only if every batch failed.
+        
+        Args:
+            questions: The questions being answered.
+            selections: User's selected choices, aligned with questions.
+            topic: Topic of the quiz.
+            learning_profile: Optional learning profile (updated in place with every evaluated outcome).
+            quiz_context: Optional quiz context (style, complexity, language, etc.) to adapt feedback.
+            semaphore: Optional semaphore held around each batch call to cap in-flight LLM requests.
+        
+        Returns:
+            One ResponseEvaluation per question in input order (None where it was not evaluated).
+        """
+        if learning_profile is None:
+            learning_profile = LearningProfile()
+        elif isinstance(learning_profile, dict):
+            learning_profile = LearningProfile.from_dict(learning_profile)
+        
+        async def evaluate_chunk(start: int) -> List[Optional[Dict[str, Any]]]:
+            async with semaphore or contextlib.nullcontext():
+                return await asyncio.to_thread(
+                    evaluate_responses,
+                    questions[start:start + EVALUATION_BATCH_SIZE],
+                    selections[start:start + EVALUATION_BATCH_SIZE],
+                    topic,
+                    learning_profile,
+                    agent=self,
+                    quiz_context=quiz_context
+                )
+        
+        starts = range(0, len(questions), EVALUATION_BATCH_SIZE)
+        batch_results = await asyncio.gather(
+            *[evaluate_chunk(start) for start in starts], return_exceptions=True
+        )
+        if batch_results and all(isinstance(result, Exception) for result in batch_results):
+            raise batch_results[0]
+        
+        # Outcomes are recorded after all batches finish so the profile is not mutated mid-prompt
+        evaluations: List[Optional[ResponseEvaluation]] = []
+        for start, results in zip(starts, batch_results):
+            if isinstance(results, Exception):
+                logging.error(f"Evaluation batch at {start} failed: {type(results).__name__}: {results}")
+                evaluations.extend([None] * len(questions[start:start + EVALUATION_BATCH_SIZE]))
+                continue
+            # Answers without a result stay None (never recorded) so the caller can fall back
+            for result in results:
+                evaluations.append(
+                    self._build_evaluation(result, topic, learning_profile) if result is not None else None
+                )
+        
+        return evaluations
+    
+    
+    @staticmethod
+    def _build_evaluation(result: Dict[str, Any], topic: str, learning_profile: LearningProfile) -> ResponseEvaluation:
+        """Build a ResponseEvaluation from one batched result and record its outcome."""
+        error_evaluation = ErrorEvaluation.from_dict({
+            "error_type": result.get("error_type", "conceptual_misunderstanding"),
+            "confidence": result.get("confidence", 0.5),
+            "reasoning": result.get("reasoning", "Unable to parse")
+        })
+        learning_profile.record_answer(topic, error_evaluation.error_type)
+        
+        feedback_data = result.get("feedback") or {}
+        feedback = Feedback(
+            concept=feedback_data.get("concept", ""),
+            explanation=feedback_data.get("explanation", ""),
+            key_points=feedback_data.get("key_points", []),
+            hints=feedback_data.get("hints")
+        )
+        
+        suggestions = [
+            LearningSuggestion(
+                title=item.get("title", "Learning suggestion"),
+                explanation=item.get("explanation", ""),
+                resources=item.get("resources", [])
+            )
+            for item in (result.get("suggestions") or [])[:3]
+            if isinstance(item, dict)
+        ]
         
         return ResponseEvaluation(
             feedback=feedback,
@@ -1,9 +1,12 @@
 """GeneratorAgent for autonomous quiz creation from topic descriptions."""
 
-from typing import List, Optional, Callable, Tuple
+import asyncio
+import logging
+from typing import List, Optional, Callable
 
-from ..models import Quiz, Question
+from ..models import Quiz
 from .agent import Agent
+from .pipeline import generate_validated_questions
 from .schemas import (
     QuizProfile,
     QuizContext,
@@ -34,15 +37,47 @@ class GeneratorAgent(Agent):
         profile: QuizProfile,
         question_count: int = 15,
     ) -> Quiz:
-        """Generate a new quiz from a high-level topic description."""
+        """Generate a new quiz from a high-level topic description.
+        
+        Synchronous wrapper around generate_quiz_async; must not be called from a running event loop.
+        """
+        return asyncio.run(self.generate_quiz_async(topic_description, profile, question_count=question_count))
+
+    async def generate_quiz_async(
+        self,
+        topic_description: str,
+        profile: QuizProfile,
+        question_count: int = 15,
+    ) -> Quiz:
+        """Generate a new quiz, planning topic coverage while the quiz profile is extracted.
+        
+        Coverage planning starts speculatively with the caller's profile and question count;
+        the plan is kept if the extracted profile agrees on the fields that shape it
+        (language, complexity, style, audience, question count), otherwise it is re-planned.
+        """
 
-        quiz_topic, quiz_profile, suggested_time_limit, suggested_question_count = extract_quiz_profile(
+        speculative_context = QuizContext(profile=profile, covered_concepts=[])
+        speculative_coverage = asyncio.create_task(asyncio.to_thread(
+            plan_topic_coverage,
             topic_description=topic_description,
-            agent=self,
-            quiz_profile=profile
-        )
+            quiz_context=speculative_context,
+            question_count=question_count,
+            agent=self
+        ))
+        
+        try:
+            quiz_topic, quiz_profile, suggested_time_limit, suggested_question_count = await asyncio.to_thread(
+                extract_quiz_profile,
+                topic_description=topic_description,
+                agent=self,
+                quiz_profile=profile
+            )
+        except BaseException:
+            self._discard(speculative_coverage)
+            raise
         
         # Use suggested question count if provided (non-zero), otherwise use the parameter
+        planned_count = question_count
         question_count = suggested_question_count if suggested_question_count > 0 else question_count
         
         quiz_context: QuizContext = QuizContext(
@@ -50,28 +85,33 @@ class GeneratorAgent(Agent):
             covered_concepts=[]  # Empty for new quiz
         )
         
-        topic_coverage: TopicCoverage = plan_topic_coverage(
-            topic_description=topic_description,
-            quiz_context=quiz_context,
-            question_count=question_count,
-            agent=self
-        )
+        topic_coverage: Optional[TopicCoverage] = None
+        if question_count == planned_count and self._same_plan_profile(profile, quiz_profile):
+            try:
+                topic_coverage = await speculative_coverage
+            except Exception:
+                topic_coverage = None  # Re-plan below with the extracted profile
+        else:
+            self._discard(speculative_coverage)
         
-        new_questions, time_limit = generate_questions(
+        if topic_coverage is None:
+            topic_coverage = await asyncio.to_thread(
+                plan_topic_coverage,
+                topic_description=topic_description,
+                quiz_context=quiz_context,
+                question_count=question_count,
+                agent=self
+            )
+        
+        validated_questions, new_questions, time_limit = await generate_validated_questions(
+            self,
             topic=quiz_topic,
             samples=[], # No existing samples for new quiz
             count=question_count,
             quiz_context=quiz_context,
             topic_coverage=topic_coverage,
-            agent=self,
-            suggested_time_limit=suggested_time_limit
-        )
-        
-        validated_questions: List[Question] = validate_questions(
-            new_questions=new_questions,
             existing_questions=[],  # No existing questions for new quiz
-            quiz_context=quiz_context,
-            agent=self
+            suggested_time_limit=suggested_time_limit
         )
                 
         return Quiz(
@@ -80,4 +120,31 @@ class GeneratorAgent(Agent):
             time_limit=time_limit
         )
 
+    @staticmethod
+    def _discard(task: "asyncio.Task[TopicCoverage]") -> None:
+        """Drop a speculative plan, retrieving its outcome so a late failure is not reported as unhandled.
+        
+        Cancelling only helps while the task is queued; once its worker thread has started,
+        the LLM call runs to completion and its result is ignored.
+        """
+        def consume(done: "asyncio.Task[TopicCoverage]") -> None:
+            if not done.cancelled() and done.exception() is not None:
+                logging.debug(f"Discarded coverage plan failed: {done.exception()}")
+        task.cancel()
+        task.add_done_callback(consume)
+
+    @staticmethod
+    def _same_plan_profile(initial: QuizProfile, extracted: QuizProfile) -> bool:
+        """Whether a coverage plan made with the initial profile still fits the extracted one.
+        
+        Domain is not compared: the user profile never sets it, and the topic description
+        the planner reads already names the subject.
+        """
+        return (
+            initial.language == extracted.language
+            and initial.complexity == extracted.complexity
+            and initial.style == extracted.style
+            and initial.target_audience == extracted.target_audience
+        )
+
 
@@ -0,0 +1,138 @@
+"""Sharded generate-then-validate pipeline shared by the quiz agents."""
+
+import asyncio
+import logging
+import re
+from typing import Iterable, List, Optional, Set, Tuple
+
+from ..models import Question
+from .agent import Agent
+from .schemas import QuizContext, TopicCoverage
+from .tools import generate_questions, validate_questions
+
+# Questions requested per concurrent generation call (each shard is validated as one window)
+GENERATION_SHARD_SIZE = 5
+
+# Summed shard time limits are rounded once to this granularity (seconds)
+TIME_LIMIT_ROUNDING = 300
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _question_key(question: Question) -> str:
+    """Normalized question text (case, punctuation and spacing ignored) for duplicate detection."""
+    return " ".join(_WORD_PATTERN.findall(question.text.casefold()))
+
+
+def _dedupe(questions: Iterable[Question], seen: Set[str]) -> List[Question]:
+    """Drop questions whose normalized text is already in seen (seen is updated)."""
+    unique: List[Question] = []
+    for question in questions:
+        key = _question_key(question)
+        if key not in seen:
+            seen.add(key)
+            unique.append(question)
+    return unique
+
+
+async def generate_validated_questions(
+    agent: Agent,
+    topic: str,
+    samples: List[Question],
+    count: int,
+    quiz_context: QuizContext,
+    topic_coverage: TopicCoverage,
+    existing_questions: List[Question],
+    suggested_time_limit: int = 0
+) -> Tuple[List[Question], List[Question], int]:
+    """Generate questions in concurrent shards, validating each shard as soon as it is generated.
+
+    Every shard focuses on a distinct slice of the coverage gaps and suggested concepts, so
+    validation of early shards overlaps generation of later ones instead of waiting for all.
+
+    Args:
+        agent: Agent instance for LLM access.
+        topic: The quiz topic.
+        samples: Sample questions to match style from.
+        count: Total number of questions to generate.
+        quiz_context: Quiz profile and covered concepts.
+        topic_coverage: Coverage plan, split across shards.
+        existing_questions: Questions the new ones are validated against.
+        suggested_time_limit: As for generate_questions; a positive limit is split across shards
+            in proportion to their question count, and the unrounded refined shares are summed
+            and rounded once to TIME_LIMIT_ROUNDING.
+
+    Returns:
+        Tuple of (validated questions, all generated questions, time limit in seconds), with
+        questions in shard order; questions repeating an existing or earlier one are dropped.
+        Duplicates are matched on exact normalized text (case, punctuation and spacing), so
+        paraphrases of the same question across shards are not caught.
+
+    Raises:
+        Exception: The first shard's error, if every shard failed.
+    """
+    shard_counts = [
+        min(GENERATION_SHARD_SIZE, count - start)
+        for start in range(0, count, GENERATION_SHARD_SIZE)
+    ]
+    shard_total = len(shard_counts)
+
+    async def run_shard(i: int, shard_count: int) -> Tuple[List[Question], Optional[List[Question]], int]:
+        shard_time_limit = max(1, suggested_time_limit * shard_count // count) if suggested_time_limit > 0 else suggested_time_limit
+        generated, time_limit = await asyncio.to_thread(
+            generate_questions,
+            topic=topic,
+            samples=samples,
+            count=shard_count,
+            quiz_context=quiz_context,
+            topic_coverage=TopicCoverage(
+                gaps=topic_coverage.gaps[i::shard_total],
+                suggested_concepts=topic_coverage.suggested_concepts[i::shard_total]
+            ),
+            agent=agent,
+            suggested_time_limit=shard_time_limit,
+            round_time_limit=False
+        )
+        try:
+            validated = await asyncio.to_thread(
+                validate_questions,
+                new_questions=generated,
+                existing_questions=existing_questions,
+                quiz_context=quiz_context,
+                agent=agent
+            ) if generated else []
+        except Exception as e:
+            logging.error(f"Question validation for shard {i} failed: {type(e).__name__}: {e}")
+            validated = None
+        return generated, validated, time_limit
+
+    results = await asyncio.gather(
+        *[run_shard(i, shard_count) for i, shard_count in enumerate(shard_counts)],
+        return_exceptions=True
+    )
+    if results and all(isinstance(result, Exception) for result in results):
+        raise results[0]
+
+    validated_questions: List[Question] = []
+    generated_questions: List[Question] = []
+    time_limits: List[int] = []
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logging.error(f"Question generation shard {i} failed: {type(result).__name__}: {result}")
+            continue
+        generated, validated, time_limit = result
+        generated_questions.extend(generated)
+        validated_questions.extend(validated or [])
+        time_limits.append(time_limit)
+
+    # Shards are validated independently, so drop cross-shard (and existing) duplicates here
+    existing_keys = {_question_key(question) for question in existing_questions}
+    validated_questions = _dedupe(validated_questions, set(existing_keys))
+    generated_questions = _dedupe(generated_questions, existing_keys)
+
+    # Refined shares add up to the quiz limit; 0 (untimed) and -1 (preserve) pass through
+    time_limit = suggested_time_limit
+    if suggested_time_limit > 0 and time_limits:
+        rounded = round(sum(time_limits) / TIME_LIMIT_ROUNDING) * TIME_LIMIT_ROUNDING
+        time_limit = max(TIME_LIMIT_ROUNDING, rounded)
+    return validated_questions, generated_questions, time_limit
@@ -4,7 +4,7 @@ Defines clear data structures for parameters and return types.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from enum import StrEnum
 
 from ..models import Question, Choice
@@ -28,7 +28,32 @@ class ErrorType(StrEnum):
         """Handle unknown values by defaulting to CONCEPTUAL_MISUNDERSTANDING."""
         return cls.CONCEPTUAL_MISUNDERSTANDING
 
-@dataclass
+
+# Value -> member lookup (skips the enum call machinery on hot from_dict paths)
+_ERROR_TYPES: Dict[str, ErrorType] = {error_type.value: error_type for error_type in ErrorType}
+# Same fallback as ErrorType._missing_
+_DEFAULT_ERROR_TYPE = ErrorType.CONCEPTUAL_MISUNDERSTANDING
+
+
+def _to_error_type(value: Any) -> ErrorType:
+    """Coerce a value to ErrorType (unknown values default to CONCEPTUAL_MISUNDERSTANDING)."""
+    try:
+        return _ERROR_TYPES.get(value, _DEFAULT_ERROR_TYPE)
+    except TypeError:  # Unhashable value
+        return _DEFAULT_ERROR_TYPE
+
+
+# ErrorType -> index into TopicProficiency.error_counts (CORRECT is declared first, so index 0)
+_ERROR_ORDINALS: Dict[ErrorType, int] = {error_type: i for i, error_type in enumerate(ErrorType)}
+_CORRECT_ORDINAL = _ERROR_ORDINALS[ErrorType.CORRECT]
+# Serialized error type names in ordinal order (iterating the enum class per call is slow)
+_ERROR_VALUES = tuple(error_type.value for error_type in ErrorType)
+# Serialized error type name -> ordinal (unknown names count as CONCEPTUAL_MISUNDERSTANDING)
+_ERROR_VALUE_ORDINALS: Dict[str, int] = {value: i for i, value in enumerate(_ERROR_VALUES)}
+_DEFAULT_ERROR_ORDINAL = _ERROR_ORDINALS[_DEFAULT_ERROR_TYPE]
+
+
+@dataclass(frozen=True, slots=True)
 class ErrorEvaluation:
     """Error evaluation result from error_evaluator tool.
     
@@ -45,7 +70,7 @@ class ErrorEvaluation:
     def from_dict(cls, data: Dict[str, Any]) -> "ErrorEvaluation":
         """Create from dictionary."""
         return cls(
-            error_type=ErrorType(data.get("error_type", "conceptual_misunderstanding")),
+            error_type=_to_error_type(data.get("error_type", _DEFAULT_ERROR_TYPE)),
             confidence=data.get("confidence", 0.5),
             reasoning=data.get("reasoning", "")
         )
@@ -63,7 +88,7 @@ class ErrorEvaluation:
 # EVALUATION
 # ==============================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PedagogicalContext:
     """Pedagogical context information for feedback generation."""
     topic: str
@@ -88,7 +113,7 @@ class PedagogicalContext:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Feedback:
     """Structured feedback for an answer."""
     concept: str
@@ -106,7 +131,7 @@ class Feedback:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResponseEvaluation:
     """Result from evaluate method."""
     feedback: "Feedback"
@@ -116,13 +141,12 @@ class ResponseEvaluation:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        data = {
+        return {
             "feedback": self.feedback.to_dict(),
             "error_evaluation": self.error_evaluation.to_dict(),
             "learning_profile": self.learning_profile.to_dict(),
             "suggestions": [s.to_dict() for s in self.suggestions] if self.suggestions else None
         }
-        return data
 
 
 # ==============================
@@ -130,46 +154,83 @@ class ResponseEvaluation:
 # ==============================
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicProficiency:
     """Proficiency statistics for a single topic."""
     topic: str
-    error_counts: Dict[ErrorType, int] = field(default_factory=dict)
+    # Answer counts indexed by ErrorType ordinal (see _ERROR_ORDINALS)
+    error_counts: List[int] = field(default_factory=lambda: [0] * len(_ERROR_ORDINALS))
+    # Sum of error_counts (kept in sync by record)
+    _total: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._total = sum(self.error_counts)
     
     @property
     def total_answers(self) -> int:
         """Total answers for this topic."""
-        return sum(self.error_counts.values())
+        return self._total
     
     @property
     def correct_answers(self) -> int:
         """Number of correct answers."""
-        return self.error_counts.get(ErrorType.CORRECT, 0)
+        return self.error_counts[_CORRECT_ORDINAL]
     
     @property
     def accuracy(self) -> float:
         """Accuracy ratio (0.0-1.0)."""
-        return self.correct_answers / self.total_answers if self.total_answers > 0 else 0.0
+        total = self._total
+        return self.error_counts[_CORRECT_ORDINAL] / total if total > 0 else 0.0
     
     def get_error_count(self, error_type: ErrorType) -> int:
         """Get count for a specific error type."""
-        return self.error_counts.get(error_type, 0)
+        return self.error_counts[_ERROR_ORDINALS[error_type]]
+    
+    def record(self, error_type: ErrorType, count: int = 1) -> None:
+        """Add count answers with the given outcome."""
+        self.error_counts[_ERROR_ORDINALS[error_type]] += count
+        self._total += count
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningProfile:
     """User learning performance profile."""
     topic_proficiencies: List[TopicProficiency] = field(default_factory=list)
+    # Topic name -> entry in topic_proficiencies (kept in sync by record_answer)
+    _topic_index: Dict[str, TopicProficiency] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._topic_index = {tp.topic: tp for tp in self.topic_proficiencies}
     
     @property
     def total_answers(self) -> int:
         """Total answers across all topics."""
         return sum(tp.total_answers for tp in self.topic_proficiencies)
     
+    def get_error_count(self, error_type: ErrorType) -> int:
+        """Get count for a specific error type across all topics."""
+        i = _ERROR_ORDINALS[error_type]
+        return sum(tp.error_counts[i] for tp in self.topic_proficiencies)
+    
+    def iter_struggling(self) -> Iterator[Tuple[str, float]]:
+        """Lazily yield (topic, accuracy) for topics with accuracy < 0.5."""
+        for tp in self.topic_proficiencies:
+            if (accuracy := tp.accuracy) < 0.5:
+                yield tp.topic, accuracy
+    
     @property
     def struggling_topics(self) -> Dict[str, float]:
         """Topics with accuracy < 0.5."""
-        return {tp.topic: tp.accuracy for tp in self.topic_proficiencies if tp.accuracy < 0.5}
+        return dict(self.iter_struggling())
+    
+    def record_answer(self, topic: str, error_type: ErrorType) -> None:
+        """Record an answer outcome for a topic (modified in place)."""
+        topic_entry = self._topic_index.get(topic)
+        if topic_entry is None:
+            topic_entry = TopicProficiency(topic=topic)
+            self.topic_proficiencies.append(topic_entry)
+            self._topic_index[topic] = topic_entry
+        topic_entry.record(error_type)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LearningProfile":
@@ -177,22 +238,22 @@ class LearningProfile:
         topic_proficiencies = []
         topic_proficiencies_data = data.get("topic_proficiencies", {})
         for topic, stats in topic_proficiencies_data.items():
-            topic_proficiencies.append(TopicProficiency(
-                topic=topic,
-                error_counts={ErrorType(k): v for k, v in stats.items()}
-            ))
+            error_counts = [0] * len(_ERROR_VALUES)
+            for k, v in stats.items():
+                error_counts[_ERROR_VALUE_ORDINALS.get(k, _DEFAULT_ERROR_ORDINAL)] += v
+            topic_proficiencies.append(TopicProficiency(topic=topic, error_counts=error_counts))
         return cls(topic_proficiencies=topic_proficiencies)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         topic_proficiencies = {
-            tp.topic: {k.value: v for k, v in tp.error_counts.items()}
+            tp.topic: {error_type: count for error_type, count in zip(_ERROR_VALUES, tp.error_counts) if count}
             for tp in self.topic_proficiencies
         }
         return {"topic_proficiencies": topic_proficiencies}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LearningSuggestion:
     """AI-generated learning suggestion."""
     title: str
@@ -252,7 +313,21 @@ class TargetAudience(StrEnum):
         return cls.UNDERGRADUATE
 
 
-@dataclass
+# Value -> member lookups for QuizProfile.from_dict (unknown values fall back to the _missing_ defaults)
+_COMPLEXITIES: Dict[str, Complexity] = {complexity.value: complexity for complexity in Complexity}
+_STYLES: Dict[str, Style] = {style.value: style for style in Style}
+_TARGET_AUDIENCES: Dict[str, TargetAudience] = {audience.value: audience for audience in TargetAudience}
+
+
+def _to_member(lookup: Dict[str, Any], value: Any, default: Any) -> Any:
+    """Look up an enum member by value (unknown or unhashable values return default)."""
+    try:
+        return lookup.get(value, default)
+    except TypeError:  # Unhashable value
+        return default
+
+
+@dataclass(frozen=True, slots=True)
 class QuizProfile:
     """Core characteristics of a quiz/topic shared across workflows."""
     complexity: Complexity = Complexity.INTERMEDIATE
@@ -265,11 +340,11 @@ class QuizProfile:
     def from_dict(cls, data: Dict[str, Any]) -> "QuizProfile":
         """Create from dictionary."""
         return cls(
-            complexity=Complexity(data.get("complexity", "intermediate")),
+            complexity=_to_member(_COMPLEXITIES, data.get("complexity"), Complexity.INTERMEDIATE),
             language=data.get("language", "en"),
             domain=data.get("domain", "general"),
-            style=Style(data.get("style", "academic")),
-            target_audience=TargetAudience(data.get("target_audience", "undergraduate"))
+            style=_to_member(_STYLES, data.get("style"), Style.ACADEMIC),
+            target_audience=_to_member(_TARGET_AUDIENCES, data.get("target_audience"), TargetAudience.UNDERGRADUATE)
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -283,7 +358,7 @@ class QuizProfile:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuizContext:
     """Context extracted from quiz_context_extractor tool."""
     profile: QuizProfile
@@ -300,13 +375,11 @@ class QuizContext:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         result = self.profile.to_dict()
-        result.update({
-            "covered_concepts": self.covered_concepts
-        })
+        result["covered_concepts"] = self.covered_concepts
         return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TopicCoverage:
     """Topic coverage analysis result from topic_coverage_analyzer tool."""
     gaps: List[str] = field(default_factory=list)
@@ -1,4 +1,9 @@
-"""Tools available for agents to use."""
+"""Tools available for agents to use.
+
+Tool prompts keep their static parts (system prompt, instructions) in module
+constants ahead of the per-call text, so the shared prefix can be served from
+the provider's prompt cache.
+"""
 
 from .error_evaluator import evaluate_error
 from .pedagogy_extractor import extract_pedagogical_context
@@ -10,6 +15,7 @@ from .quiz_profile_extractor import extract_quiz_profile
 from .topic_coverage_planner import plan_topic_coverage
 from .question_generator import generate_questions
 from .question_validator import validate_questions
+from .batch_evaluator import evaluate_responses
 
 __all__ = [
     "evaluate_error",
@@ -21,5 +27,6 @@ __all__ = [
     "extract_quiz_profile",
     "plan_topic_coverage",
     "generate_questions",
-    "validate_questions"
+    "validate_questions",
+    "evaluate_responses"
 ]
@@ -0,0 +1,172 @@
+"""Tool for evaluating several answers of one quiz in a single LLM call."""
+
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from ..agent import Agent
+    from ...models import Question, Choice
+
+from ...models import join_choice_texts
+from ..schemas import ErrorType, LearningProfile, QuizContext
+
+_SYSTEM_PROMPT = """
+You are an experienced educator and educational psychologist specializing in cognitive assessment, formative feedback and personalized learning pathways. You classify student errors with precision, explain concepts clearly and constructively, and recommend actionable, evidence-based next steps.
+"""
+
+_INSTRUCTIONS = """
+**Task:** Evaluate each of the student's answers listed at the end. For every answer, classify the error, then write feedback and learning suggestions.
+
+**Classification Categories (for incorrect answers):**
+1. **conceptual_misunderstanding** - Fundamental misunderstanding of core concepts
+2. **partial_understanding** - Some correct knowledge but missing key elements
+3. **terminology_confusion** - Confusion between similar terms or definitions
+4. **application_error** - Understands concept but misapplies it
+5. **careless_mistake** - Simple oversight or calculation error
+
+**Instructions (for each answer):**
+- **error_type**: "correct" if the result is correct, otherwise ONE of the five categories above
+- **confidence** (0.0-1.0) and **reasoning** (1-2 sentences) for the classification
+- **feedback**: concept (1-2 sentences), explanation of what went wrong or right (1-2 sentences), 2-4 key points, and 1-2 hints only if the answer is incorrect (otherwise null)
+- **suggestions**: 1-2 encouraging next steps if correct, 2-3 targeted suggestions if incorrect, each with a title (5-8 words), explanation (2-3 sentences) and 1-2 resources
+- Use markdown (**bold**, *italic*, `inline code`, code blocks) judiciously where it adds clarity
+- Be encouraging and supportive; avoid condescension or judgment
+
+**Output Format (JSON):**
+{
+  "evaluations": [
+    {
+      "id": 0,
+      "error_type": "correct or one of the five categories",
+      "confidence": 0.0-1.0,
+      "reasoning": "Brief explanation of the classification",
+      "feedback": {
+        "concept": "The fundamental principle or concept",
+        "explanation": "What went wrong/right and why",
+        "key_points": ["Key point 1", "Key point 2"],
+        "hints": ["Hint 1"]
+      },
+      "suggestions": [
+        {
+          "title": "Specific, actionable title",
+          "explanation": "What to learn and why it helps",
+          "resources": ["resource URL or name"]
+        }
+      ]
+    }
+  ]
+}
+Return exactly one evaluation per answer, using the answer number as "id".
+"""
+
+
+def _result_index(item_id: Any) -> Optional[int]:
+    """Coerce a result id (int or int-like string) to an answer index, or None if unusable."""
+    if isinstance(item_id, bool):
+        return None
+    if isinstance(item_id, int):
+        return item_id
+    if isinstance(item_id, float) and item_id.is_integer():
+        return int(item_id)
+    if isinstance(item_id, str) and item_id.strip().isdigit():
+        return int(item_id)
+    return None
+
+
+def evaluate_responses(
+    questions: List["Question"],
+    selections: List[List["Choice"]],
+    topic: str,
+    learning_profile: LearningProfile,
+    agent: "Agent",
+    quiz_context: Optional["QuizContext"] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """Classify errors and generate feedback and suggestions for a batch of answers.
+
+    All answers share the topic, learning profile and quiz context, so they are sent
+    as one numbered prompt instead of one request chain per answer.
+
+    Args:
+        questions: The questions being answered.
+        selections: User's selected choices, aligned with questions.
+        topic: Topic of the quiz.
+        learning_profile: Current user learning profile (read only).
+        agent: Agent instance for LLM access.
+        quiz_context: Optional quiz context (language, style, etc.) to adapt the output.
+
+    Returns:
+        One evaluation dictionary per question, in input order, with keys error_type,
+        confidence, reasoning, feedback and suggestions; None for answers the response
+        contains no result for.
+    """
+    if not questions:
+        return []
+
+    # Build adaptation requirements section if quiz_context is provided
+    adaptation_requirements = f"""
+**Adaptation Requirements:**
+- Write ALL feedback and suggestions in the {quiz_context.profile.language} language, naturally and idiomatically
+- Match the quiz's communication style ({quiz_context.profile.style})
+- Recommend resources appropriate for {quiz_context.profile.complexity} level and {quiz_context.profile.target_audience} audience
+- Focus on {quiz_context.profile.domain} domain when relevant
+""" if quiz_context else ""
+
+    struggling_topics = (topic for topic, _ in learning_profile.iter_struggling())
+    struggling_topics_str = ", ".join(islice(struggling_topics, 3)) or "None identified"
+
+    answers_txt = "\n".join(
+        f"""
+**Answer {i}:**
+- **Question:** {question.text}
+- **Correct Answer(s):** {question.correct_text}
+- **Student's Answer(s):** {join_choice_texts(selected)}
+- **Result:** {"correct" if question.is_correct_answer(selected) else "incorrect"}"""
+        for i, (question, selected) in enumerate(zip(questions, selections))
+    )
+
+    user_prompt = _INSTRUCTIONS + \
+f"""
+**Shared Context:**
+- **Topic:** {topic}
+- **Struggling Topics:** {struggling_topics_str}
+
+{adaptation_requirements}
+
+**Answers:**
+{answers_txt}
+"""
+
+    resp = agent._generate(
+        _SYSTEM_PROMPT,
+        user_prompt,
+        temperature=0.3,
+        response_format={"type": "json_object"}
+    )
+
+    parsed = agent._parse_json(resp, {"evaluations": []})
+
+    items = [item for item in parsed.get("evaluations") or [] if isinstance(item, dict)]
+
+    # Align results with the input order by id (int or int-like string)
+    ids = [_result_index(item.get("id")) for item in items]
+    if ids == list(range(1, len(questions) + 1)):
+        ids = [idx - 1 for idx in ids]  # Numbered from 1
+    evaluations: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+    for idx, item in zip(ids, items):
+        if idx is not None and 0 <= idx < len(evaluations) and evaluations[idx] is None:
+            evaluations[idx] = item
+    # Fall back to positional order only when no id matched and the counts agree;
+    # otherwise answers without a matching result stay None
+    if len(items) == len(questions) and all(evaluation is None for evaluation in evaluations):
+        evaluations = items
+
+    # Correctness is known locally; never trust the model over the answer key
+    for question, selected, evaluation in zip(questions, selections, evaluations):
+        if evaluation is None:
+            continue
+        if question.is_correct_answer(selected):
+            evaluation.update(error_type=ErrorType.CORRECT, confidence=1.0, reasoning="Exact match")
+        elif evaluation.get("error_type") == ErrorType.CORRECT:
+            evaluation["error_type"] = ErrorType.CONCEPTUAL_MISUNDERSTANDING
+
+    return evaluations
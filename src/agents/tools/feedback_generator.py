@@ -1,13 +1,71 @@
 """Tool for generating adaptive feedback based on error type and context."""
 
-from typing import TYPE_CHECKING, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from cachetools import TTLCache
 
 if TYPE_CHECKING:
     from ..agent import Agent
     from ...models import Question, Choice
 
+from ...models import join_choice_texts
 from ..schemas import ErrorEvaluation, ErrorType, PedagogicalContext, Feedback, QuizContext
 
+# Feedback payloads keyed by every prompt input (answer situation, error analysis, pedagogical context)
+FEEDBACK_CACHE_MAXSIZE = 4096
+FEEDBACK_CACHE_TTL_SECONDS = 24 * 3600
+_feedback_cache: TTLCache = TTLCache(maxsize=FEEDBACK_CACHE_MAXSIZE, ttl=FEEDBACK_CACHE_TTL_SECONDS)
+_feedback_cache_lock = threading.Lock()
+
+_SYSTEM_PROMPT = """
+You are an experienced educator and learning facilitator specializing in adaptive instruction and formative feedback. Your expertise includes explaining complex concepts clearly, addressing misconceptions constructively, and guiding students toward deeper understanding. You adapt your communication style based on error types to maximize learning outcomes.
+"""
+
+_INSTRUCTIONS = """
+**Task:** Generate structured, personalized feedback that helps the student understand their answer below and learn from it.
+
+**Instructions:**
+Generate feedback with the following components in the quiz's language (see the language requirement below, if given):
+
+1. **Concept** (1-2 sentences): State the fundamental principle, rule, or concept being tested. This should be the core idea the student needs to understand.
+
+2. **Explanation** (1-2 sentences): Explain what went wrong (or right) in the student's answer. Be specific about their reasoning error or correct understanding. Use a supportive, constructive tone.
+
+3. **Key Points** (2-4 items): Provide a bulleted list of critical distinctions, important facts, or key takeaways that will help the student understand the concept better. Each point should be concise (one sentence or phrase).
+
+4. **Hints** (only if answer is incorrect, 1-2 items): Provide subtle guidance that helps the student think through the problem without giving away the answer. These should encourage self-discovery.
+
+**Tone Guidelines:**
+- Be encouraging and supportive
+- Focus on learning, not just correctness
+- Use clear, accessible language
+- Avoid condescension or judgment
+
+**Formatting Guidelines:**
+Use markdown formatting to enhance readability and emphasize important information:
+- **Bold** (`**text**`): Use for key terms, important concepts, or critical information that students should remember
+- *Italic* (`*text*`): Use for emphasis, definitions, or subtle highlights
+- `Inline code` (`` `code` ``): Use for technical terms, function names, variables, or short code snippets
+- Code blocks (```` ```language\ncode\n```` ```): Use for longer code examples or multi-line snippets when demonstrating concepts. Example: `` ```python\ndef example():\n    pass\n``` ``
+- **Spacing**: Single line breaks are preserved. For additional spacing, use HTML: `<br>` for line breaks, `&nbsp;` for extra spaces, or multiple line breaks for paragraph spacing.
+- Use formatting judiciously—only when it adds clarity or emphasis, not excessively
+
+Examples:
+- "The **agent** in agentic AI refers to an autonomous entity that *perceives and acts* in its environment."
+- "In Python, the `__init__` method is called when creating a new instance."
+- "Remember that **autonomy** is the key characteristic, not just *intelligence*."
+- For code examples: Use code blocks when showing implementation patterns or longer snippets
+
+**Output Format (JSON):**
+{
+  "concept": "The fundamental principle or concept (1-2 sentences)",
+  "explanation": "What went wrong/right and why (1-2 sentences)",
+  "key_points": ["Key point 1", "Key point 2", "Key point 3"],
+  "hints": ["Hint 1", "Hint 2"]  // Include only if answer is incorrect, otherwise null
+}
+"""
+
 
 def generate_feedback(
     question: "Question",
@@ -42,20 +100,31 @@ def generate_feedback(
 - Ensure grammatical correctness and appropriate tone for the {quiz_context.profile.language} language
 """ if quiz_context else ""
     
-    system_prompt = \
-f"""
-You are an experienced educator and learning facilitator specializing in adaptive instruction and formative feedback. Your expertise includes explaining complex concepts clearly, addressing misconceptions constructively, and guiding students toward deeper understanding. You adapt your communication style based on error types to maximize learning outcomes.
-"""
+    correct_txt = question.correct_text
+    selected_txt = join_choice_texts(selected)
     
-    correct_txt = ', '.join(c.text for c in question.correct_choices)
-    selected_txt = ', '.join(c.text for c in selected)
     concepts = ', '.join(eval_context.related_concepts) if eval_context.related_concepts else "None identified"
     misconceptions = ', '.join(eval_context.common_misconceptions) if eval_context.common_misconceptions else "None identified"
     
-    user_prompt = \
+    # Reuse feedback generated for the same answer and analysis (every prompt input is keyed)
+    cache_key = (
+        agent.model,
+        question.text,
+        correct_txt,
+        tuple(sorted(choice.text for choice in selected)),
+        err_type.value,
+        error_analysis.reasoning,
+        concepts,
+        misconceptions,
+        quiz_context.profile.language if quiz_context else None
+    )
+    with _feedback_cache_lock:
+        feedback_data: Optional[Dict[str, Any]] = _feedback_cache.get(cache_key)
+    if feedback_data is not None:
+        return _to_feedback(feedback_data)
+    
+    user_prompt = _INSTRUCTIONS + \
 f"""
-**Task:** Generate structured, personalized feedback that helps the student understand their answer and learn from it.
-
 **Question Context:**
 - **Question:** {question.text}
 - **Correct Answer(s):** {correct_txt}
@@ -70,50 +139,10 @@ f"""
 - **Common Misconceptions:** {misconceptions}
 
 {language_requirement}
-
-**Instructions:**
-Generate feedback with the following components{f" in the {quiz_context.profile.language} language" if quiz_context else " in the quiz's language"}:
-
-1. **Concept** (1-2 sentences): State the fundamental principle, rule, or concept being tested. This should be the core idea the student needs to understand.
-
-2. **Explanation** (1-2 sentences): Explain what went wrong (or right) in the student's answer. Be specific about their reasoning error or correct understanding. Use a supportive, constructive tone.
-
-3. **Key Points** (2-4 items): Provide a bulleted list of critical distinctions, important facts, or key takeaways that will help the student understand the concept better. Each point should be concise (one sentence or phrase).
-
-4. **Hints** (only if answer is incorrect, 1-2 items): Provide subtle guidance that helps the student think through the problem without giving away the answer. These should encourage self-discovery.
-
-**Tone Guidelines:**
-- Be encouraging and supportive
-- Focus on learning, not just correctness
-- Use clear, accessible language
-- Avoid condescension or judgment
-
-**Formatting Guidelines:**
-Use markdown formatting to enhance readability and emphasize important information:
-- **Bold** (`**text**`): Use for key terms, important concepts, or critical information that students should remember
-- *Italic* (`*text*`): Use for emphasis, definitions, or subtle highlights
-- `Inline code` (`` `code` ``): Use for technical terms, function names, variables, or short code snippets
-- Code blocks (```` ```language\ncode\n```` ```): Use for longer code examples or multi-line snippets when demonstrating concepts. Example: `` ```python\ndef example():\n    pass\n``` ``
-- **Spacing**: Single line breaks are preserved. For additional spacing, use HTML: `<br>` for line breaks, `&nbsp;` for extra spaces, or multiple line breaks for paragraph spacing.
-- Use formatting judiciously—only when it adds clarity or emphasis, not excessively
-
-Examples:
-- "The **agent** in agentic AI refers to an autonomous entity that *perceives and acts* in its environment."
-- "In Python, the `__init__` method is called when creating a new instance."
-- "Remember that **autonomy** is the key characteristic, not just *intelligence*."
-- For code examples: Use code blocks when showing implementation patterns or longer snippets
-
-**Output Format (JSON):**
-{{
-  "concept": "The fundamental principle or concept (1-2 sentences)",
-  "explanation": "What went wrong/right and why (1-2 sentences)",
-  "key_points": ["Key point 1", "Key point 2", "Key point 3"],
-  "hints": ["Hint 1", "Hint 2"]  // Include only if answer is incorrect, otherwise null
-}}
 """
     
     resp = agent._generate(
-        system_prompt,
+        _SYSTEM_PROMPT,
         user_prompt,
         temperature=0.3,
         response_format={"type": "json_object"}
@@ -126,10 +155,21 @@ Examples:
         "hints": None
     })
     
+    # Only cache usable feedback (not the fallback for an unparseable response)
+    if parsed.get("concept") or parsed.get("explanation"):
+        with _feedback_cache_lock:
+            _feedback_cache[cache_key] = parsed
+    
+    return _to_feedback(parsed)
+
+
+def _to_feedback(feedback_data: Dict[str, Any]) -> Feedback:
+    """Build a fresh Feedback object (cached payloads are shared and never mutated)."""
+    hints = feedback_data.get("hints")
     return Feedback(
-        concept=parsed.get("concept", ""),
-        explanation=parsed.get("explanation", ""),
-        key_points=parsed.get("key_points", []),
-        hints=parsed.get("hints")
+        concept=feedback_data.get("concept", ""),
+        explanation=feedback_data.get("explanation", ""),
+        key_points=list(feedback_data.get("key_points") or []),
+        hints=list(hints) if hints else hints
     )
 
@@ -8,6 +8,31 @@ if TYPE_CHECKING:
 
 from ..schemas import ErrorEvaluation, ErrorType, PedagogicalContext, LearningProfile
 
+_SYSTEM_PROMPT = """
+You are a curriculum specialist and pedagogical expert with deep knowledge of learning science, common student misconceptions, and concept relationships across academic domains. Your role is to identify relevant educational context that will help personalize feedback and address learning gaps effectively.
+"""
+
+_INSTRUCTIONS = """
+**Task:** Identify related educational concepts and common misconceptions relevant to the learning situation described in the context below.
+
+**Instructions:**
+1. **Related Concepts:** Identify 2-4 fundamental concepts, principles, or prerequisite knowledge that are directly relevant to understanding this question and the error made. These should be concepts that, if understood, would help the student answer correctly.
+
+2. **Common Misconceptions:** Identify 2-4 specific misconceptions that students typically have related to this topic and error type. These should be concrete, specific misunderstandings (not vague generalities) that educators commonly observe.
+
+**Guidelines:**
+- Be specific and actionable
+- Focus on concepts directly related to the question and error
+- Prioritize the most important and commonly encountered items
+- Use clear, concise terminology
+
+**Output Format (JSON):**
+{
+  "related_concepts": ["specific concept 1", "specific concept 2", "specific concept 3"],
+  "common_misconceptions": ["specific misconception 1", "specific misconception 2"]
+}
+"""
+
 
 def extract_pedagogical_context(
     question: "Question",
@@ -29,41 +54,17 @@ def extract_pedagogical_context(
         PedagogicalContext with context information.
     """
     
-    system_prompt = \
+    user_prompt = _INSTRUCTIONS + \
 f"""
-You are a curriculum specialist and pedagogical expert with deep knowledge of learning science, common student misconceptions, and concept relationships across academic domains. Your role is to identify relevant educational context that will help personalize feedback and address learning gaps effectively.
-"""
-    
-    user_prompt = \
-f"""
-**Task:** Identify related educational concepts and common misconceptions relevant to this learning situation.
-
 **Context:**
 - **Topic:** {topic}
 - **Question:** {question.text}
 - **Error Type:** {error_analysis.error_type}
 - **Error Reasoning:** {error_analysis.reasoning}
-
-**Instructions:**
-1. **Related Concepts:** Identify 2-4 fundamental concepts, principles, or prerequisite knowledge that are directly relevant to understanding this question and the error made. These should be concepts that, if understood, would help the student answer correctly.
-
-2. **Common Misconceptions:** Identify 2-4 specific misconceptions that students typically have related to this topic and error type. These should be concrete, specific misunderstandings (not vague generalities) that educators commonly observe.
-
-**Guidelines:**
-- Be specific and actionable
-- Focus on concepts directly related to the question and error
-- Prioritize the most important and commonly encountered items
-- Use clear, concise terminology
-
-**Output Format (JSON):**
-{{
-  "related_concepts": ["specific concept 1", "specific concept 2", "specific concept 3"],
-  "common_misconceptions": ["specific misconception 1", "specific misconception 2"]
-}}
 """
     
     resp = agent._generate(
-        system_prompt,
+        _SYSTEM_PROMPT,
         user_prompt,
         temperature=0.3,
         response_format={"type": "json_object"}
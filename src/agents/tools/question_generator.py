@@ -10,97 +10,14 @@ if TYPE_CHECKING:
 from ...parser import parse_questions
 from ..schemas import QuizContext, TopicCoverage, QuizProfile
 
+_TIME_LIMIT_PATTERN = re.compile(r'^TIME_LIMIT:\s*(\d+)\s*$', re.MULTILINE | re.IGNORECASE)
 
-def generate_questions(
-    topic: str,
-    samples: List["Question"],
-    count: int,
-    quiz_context: QuizContext,
-    topic_coverage: TopicCoverage,
-    agent: "Agent",
-    suggested_time_limit: int = 0
-) -> Tuple[List["Question"], int]:
-    """Generate questions matching existing quiz style and complexity.
-    
-    Args:
-        topic: The quiz topic.
-        samples: Sample questions to match style from.
-        count: Number of questions to generate.
-        quiz_context: Result from quiz_context_extractor tool.
-        topic_coverage: Result from topic_coverage_analyzer tool.
-        agent: Agent instance for LLM access.
-        suggested_time_limit: Suggested time limit in seconds from topic analysis.
-            - 0: Quiz should not be timed
-            - > 0: Suggested time limit to refine based on question complexity
-            - -1: Preserve existing time limit (do not calculate new one)
-    
-    Returns:
-        Tuple of (List of generated Question objects, time limit in seconds).
-        Time limit is 0 if not timed, a calculated value if timed, or -1 if preserving existing.
-    """
-    
-    system_prompt = \
-f"""
+_SYSTEM_PROMPT = """
 You are a master educator and subject matter expert specializing in quiz design, question generation, and educational assessment. Your expertise includes creating questions that match existing styles, maintain consistency, test conceptual understanding, and address specific learning objectives. You excel at crafting questions with appropriate complexity, clear wording, and plausible distractors that reveal student misconceptions.
 """
-    
-    # Format sample questions
-    sample_text = []
-    for q in samples[:3]:
-        lines = [q.text]
-        for c in q.original_choices:
-            prefix = ">" if c.is_correct else "-"
-            lines.append(f"{prefix} {c.text}")
-        sample_text.append("\n".join(lines))
-    
-    examples = "\n\n".join(sample_text)
-    
-    # Extract relevant context
-    profile = quiz_context.profile
-    covered_concepts = ", ".join(quiz_context.covered_concepts[:5]) or "Various topics"
-    gaps = ", ".join(topic_coverage.gaps[:5]) or "None specifically identified"
-    suggested_concepts = ", ".join(topic_coverage.suggested_concepts[:5]) or "Continue existing coverage patterns"
-    
-    # Time limit calculation section (if suggested_time_limit > 0, skip if -1)
-    time_limit_section = f"""
-7. **Time Limit Calculation:**
-   - A suggested time limit of {suggested_time_limit // 60} minutes ({suggested_time_limit} seconds) was provided based on topic analysis
-   - Refine this time limit based on the actual complexity of the questions you generate:
-     * Question complexity ({profile.complexity} level)
-     * Number of questions ({count} questions)
-     * Cognitive demand (recall, comprehension, application, analysis)
-     * Target audience ({profile.target_audience})
-   - Time per question guidelines:
-     * Beginner: ~1 minute per question
-     * Intermediate: ~1-2 minutes per question
-     * Advanced: ~2-3 minutes per question
-     * Expert: ~3-4 minutes per question
-   - Add a reasonable buffer (10-20%) for reading and thinking
-   - Round to nearest 5 minutes for cleaner display
-   - If questions are more complex than typical for the level, increase the suggested time
-   - If questions are simpler, you may reduce the suggested time
-""" if suggested_time_limit > 0 else ""
 
-    user_prompt = \
-f"""
-**Task:** Generate exactly {count} new questions that match the existing quiz's style, complexity, and educational approach while addressing identified knowledge gaps.{' Additionally, refine the suggested time limit based on the actual question complexity.' if suggested_time_limit > 0 else ''}
-
-**Topic:** {topic}
-
-**Existing Quiz Profile:**
-- **Style:** {profile.style}
-- **Complexity:** {profile.complexity}
-- **Target Audience:** {profile.target_audience}
-- **Domain:** {profile.domain}
-- **Language:** {profile.language}
-
-**Content Context:**
-- **Currently Covered Concepts:** {covered_concepts}
-- **Identified Knowledge Gaps:** {gaps}
-- **Suggested Concepts for New Questions:** {suggested_concepts}
-
-**Example Questions (Study these carefully to match style and format):**
-{examples}
+_INSTRUCTIONS = """
+**Task:** Generate new questions that match the existing quiz's style, complexity, and educational approach while addressing identified knowledge gaps. The topic, quiz profile, content context, example questions and number of questions to generate are given at the end.
 
 **Quality Guidelines:**
 
@@ -143,24 +60,24 @@ class D(B, C): pass
 **Question Generation Requirements:**
 
 1. **Style Consistency:**
-   - Match the writing tone, formality, and presentation approach of the examples exactly
+   - Match the writing tone, formality, and presentation approach of the example questions below exactly
    - Use the same level of explanation and detail
    - Maintain consistency in question structure and phrasing
 
 2. **Complexity Matching:**
-   - Ensure questions are at the {profile.complexity} level
+   - Ensure questions are at the complexity level given in the quiz profile below
    - Match the cognitive demand (recall, comprehension, application, analysis)
-   - Use appropriate terminology for {profile.target_audience} level
+   - Use appropriate terminology for the target audience given in the quiz profile below
 
 3. **Content Focus:**
-   - Prioritize questions that address identified gaps: {gaps}
-   - Incorporate suggested concepts: {suggested_concepts}
+   - Prioritize questions that address the identified knowledge gaps
+   - Incorporate the suggested concepts for new questions
    - Ensure each question tests a distinct concept (avoid redundancy)
-   - Cover important aspects of {topic} comprehensively
+   - Cover important aspects of the topic comprehensively
 
 4. **Question Quality:**
    - Test conceptual understanding, not trivial recall or memorization
-   - Use clear, unambiguous language appropriate for the {profile.language} language
+   - Use clear, unambiguous language appropriate for the quiz's language
    - Create plausible distractors based on common misconceptions
    - Ensure correct answers are clearly correct and distractors are clearly incorrect
    - Avoid trick questions or ambiguous wording
@@ -185,14 +102,10 @@ class D(B, C): pass
    - **Spacing**: Single line breaks are preserved as line breaks. For additional spacing, use HTML: `<br>` for line breaks, `&nbsp;` for extra spaces, or multiple line breaks for paragraph spacing.
    - Use formatting judiciously—only when it adds clarity or emphasis. Keep formatting minimal—clarity and readability are paramount.
 
-{time_limit_section}
-
 **Output Instructions:**
-- Generate exactly {count} questions
 - Output only the questions in the specified format
 - Do not include any commentary, explanations, or additional text
 - Questions MUST NOT be numbered (no "1.", "2.", "Q1:", etc.)
-{f'- After the questions, include a single line with: "TIME_LIMIT: [seconds]" where [seconds] is the refined time limit in seconds (e.g., "TIME_LIMIT: 1800" for 30 minutes)' if suggested_time_limit > 0 else ''}
 
 **Output Format:**
 [Question text]
@@ -201,22 +114,120 @@ class D(B, C): pass
 > [Correct choice]
 - [Incorrect choice 3]
 
-[Repeat for all {count} questions]
+[Repeat for all questions]
+"""
 
-{f'{chr(10)}TIME_LIMIT: [seconds]' if suggested_time_limit > 0 else ''}
+
+def generate_questions(
+    topic: str,
+    samples: List["Question"],
+    count: int,
+    quiz_context: QuizContext,
+    topic_coverage: TopicCoverage,
+    agent: "Agent",
+    suggested_time_limit: int = 0,
+    round_time_limit: bool = True
+) -> Tuple[List["Question"], int]:
+    """Generate questions matching existing quiz style and complexity.
+    
+    Args:
+        topic: The quiz topic.
+        samples: Sample questions to match style from.
+        count: Number of questions to generate.
+        quiz_context: Result from quiz_context_extractor tool.
+        topic_coverage: Result from topic_coverage_analyzer tool.
+        agent: Agent instance for LLM access.
+        suggested_time_limit: Suggested time limit in seconds from topic analysis.
+            - 0: Quiz should not be timed
+            - > 0: Suggested time limit to refine based on question complexity
+            - -1: Preserve existing time limit (do not calculate new one)
+        round_time_limit: Whether the refined time limit is rounded to 5 minutes; disable when
+            the result is one share of a larger quiz that is rounded once after summing.
+    
+    Returns:
+        Tuple of (List of generated Question objects, time limit in seconds).
+        Time limit is 0 if not timed, a calculated value if timed, or -1 if preserving existing.
+    """
+    
+    # Format sample questions
+    sample_text = []
+    for q in samples[:3]:
+        lines = [q.text]
+        for c in q.original_choices:
+            prefix = ">" if c.is_correct else "-"
+            lines.append(f"{prefix} {c.text}")
+        sample_text.append("\n".join(lines))
+    
+    examples = "\n\n".join(sample_text)
+    
+    # Extract relevant context
+    profile = quiz_context.profile
+    covered_concepts = ", ".join(quiz_context.covered_concepts[:5]) or "Various topics"
+    gaps = ", ".join(topic_coverage.gaps[:5]) or "None specifically identified"
+    suggested_concepts = ", ".join(topic_coverage.suggested_concepts[:5]) or "Continue existing coverage patterns"
+    
+    rounding = (
+        "Round to nearest 5 minutes for cleaner display" if round_time_limit
+        else "Do not round; give the exact estimate in seconds"
+    )
+    
+    # Time limit calculation section (if suggested_time_limit > 0, skip if -1)
+    time_limit_section = f"""
+**Time Limit Calculation:**
+Additionally, refine the suggested time limit based on the actual question complexity.
+   - A suggested time limit of {suggested_time_limit // 60} minutes ({suggested_time_limit} seconds) was provided based on topic analysis
+   - Refine this time limit based on the actual complexity of the questions you generate:
+     * Question complexity ({profile.complexity} level)
+     * Number of questions ({count} questions)
+     * Cognitive demand (recall, comprehension, application, analysis)
+     * Target audience ({profile.target_audience})
+   - Time per question guidelines:
+     * Beginner: ~1 minute per question
+     * Intermediate: ~1-2 minutes per question
+     * Advanced: ~2-3 minutes per question
+     * Expert: ~3-4 minutes per question
+   - Add a reasonable buffer (10-20%) for reading and thinking
+   - {rounding}
+   - If questions are more complex than typical for the level, increase the suggested time
+   - If questions are simpler, you may reduce the suggested time
+   - After the questions, include a single line with: "TIME_LIMIT: [seconds]" where [seconds] is the refined time limit in seconds (e.g., "TIME_LIMIT: 1800" for 30 minutes)
+""" if suggested_time_limit > 0 else ""
+
+    user_prompt = _INSTRUCTIONS + \
+f"""
+**Topic:** {topic}
+
+**Existing Quiz Profile:**
+- **Style:** {profile.style}
+- **Complexity:** {profile.complexity}
+- **Target Audience:** {profile.target_audience}
+- **Domain:** {profile.domain}
+- **Language:** {profile.language}
+
+**Content Context:**
+- **Currently Covered Concepts:** {covered_concepts}
+- **Identified Knowledge Gaps:** {gaps}
+- **Suggested Concepts for New Questions:** {suggested_concepts}
+
+**Example Questions (Study these carefully to match style and format):**
+{examples}
+{time_limit_section}
+**Number of Questions:** Generate exactly {count} questions.
 """
     
     response = agent._generate(
-        system_prompt,
+        _SYSTEM_PROMPT,
         user_prompt,
         temperature=0.7
     )
     
     # Extract time limit if present, otherwise use suggested or preserve existing (-1)
     time_limit = suggested_time_limit
-    if suggested_time_limit > 0 and (match := re.search(r'^TIME_LIMIT:\s*(\d+)\s*$', response, re.MULTILINE | re.IGNORECASE)):
+    if suggested_time_limit > 0 and (match := _TIME_LIMIT_PATTERN.search(response)):
         time_limit = int(match.group(1))
-        response = re.sub(r'^TIME_LIMIT:\s*\d+\s*$', '', response, flags=re.MULTILINE | re.IGNORECASE).rstrip()
+        # Text before the first TIME_LIMIT line is kept as is (no second scan over it)
+        start = match.start()
+        response = (response[:start] + _TIME_LIMIT_PATTERN.sub('', response[start:])).rstrip()
     
     questions = parse_questions(response)
     
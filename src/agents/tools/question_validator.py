@@ -8,56 +8,14 @@ if TYPE_CHECKING:
 
 from ..schemas import QuizContext, QuizProfile
 
-
-def validate_questions(
-    new_questions: List["Question"],
-    existing_questions: List["Question"],
-    quiz_context: QuizContext,
-    agent: "Agent"
-) -> List["Question"]:
-    """Validate new questions for quality, consistency, and uniqueness.
-    
-    Args:
-        new_questions: Newly generated questions to validate.
-        existing_questions: Existing questions to compare against.
-        quiz_context: Result from quiz_context_extractor tool.
-        agent: Agent instance for LLM access.
-    
-    Returns:
-        List of validated Question objects.
-    """
-    
-    system_prompt = \
-f"""
+# The reference sample precedes the new questions so concurrent shard validations
+# of one quiz share the longest possible cached prefix
+_SYSTEM_PROMPT = """
 You are a quality assurance expert specializing in educational content validation, assessment design, and pedagogical consistency. Your expertise includes identifying duplicate concepts, style inconsistencies, complexity mismatches, language issues, and quality problems in quiz questions. You evaluate questions systematically against established criteria to ensure educational value and consistency.
 """
-    
-    # Format questions for comparison
-    existing_text = []
-    for i, q in enumerate(existing_questions[:5], 1):
-        existing_text.append(f"{i}. {q.text[:200]}")
-    
-    new_text = []
-    for i, q in enumerate(new_questions, 0):
-        new_text.append(f"Index {i}: {q.text[:200]}")
-    
-    profile = quiz_context.profile
-    
-    user_prompt = \
-f"""
-**Task:** Validate each new question for quality, consistency, uniqueness, and alignment with the existing quiz standards.
 
-**Existing Questions (Reference Sample):**
-{chr(10).join(existing_text) if existing_text else "None provided"}
-
-**New Questions to Validate:**
-{chr(10).join(new_text) if new_text else "None provided"}
-
-**Quiz Quality Standards:**
-- **Style:** {profile.style}
-- **Complexity:** {profile.complexity}
-- **Language:** {profile.language}
-- **Target Audience:** {profile.target_audience}
+_INSTRUCTIONS = """
+**Task:** Validate each new question for quality, consistency, uniqueness, and alignment with the existing quiz standards. The quiz quality standards, existing questions and new questions are given at the end.
 
 **Validation Criteria:**
 
@@ -69,17 +27,17 @@ For each new question, evaluate against these criteria:
    - Mark as invalid if it duplicates an existing question's concept
 
 2. **Style Consistency:**
-   - Does the writing tone match the {profile.style} style of existing questions?
+   - Does the writing tone match the style of existing questions given in the quiz quality standards?
    - Is the level of formality, explanation, and presentation consistent?
    - Does it use similar sentence structure and phrasing patterns?
 
 3. **Complexity Alignment:**
-   - Is the cognitive demand appropriate for {profile.complexity} level?
+   - Is the cognitive demand appropriate for the complexity level given in the quiz quality standards?
    - Does it match the depth and sophistication of existing questions?
    - Is the prerequisite knowledge requirement consistent?
 
 4. **Language Consistency:**
-   - Is the question written in the {profile.language} language?
+   - Is the question written in the language given in the quiz quality standards?
    - Is the language quality and clarity consistent with existing questions?
    - Are there any translation issues or language errors?
 
@@ -90,21 +48,65 @@ For each new question, evaluate against these criteria:
    - Is the question free from trick elements or misleading phrasing?
 
 **Validation Instructions:**
-- Review each new question (indexed 0 to {len(new_questions)-1}) against all criteria above
+- Review each new question (by its index) against all criteria above
 - Mark a question as INVALID if it fails any of the criteria
 - Mark a question as VALID only if it passes all criteria
 - Be strict but fair in your evaluation
 
 **Output Format (JSON):**
-{{
+{
   "valid_questions": [0, 1, 3, 4]
-}}
-
+}
 Provide the indices (0-based) of valid questions only.
 """
+
+
+def validate_questions(
+    new_questions: List["Question"],
+    existing_questions: List["Question"],
+    quiz_context: QuizContext,
+    agent: "Agent"
+) -> List["Question"]:
+    """Validate new questions for quality, consistency, and uniqueness.
+    
+    Args:
+        new_questions: Newly generated questions to validate.
+        existing_questions: Existing questions to compare against.
+        quiz_context: Result from quiz_context_extractor tool.
+        agent: Agent instance for LLM access.
+    
+    Returns:
+        List of validated Question objects.
+    """
+    
+    # Format questions for comparison
+    existing_text = []
+    for i, q in enumerate(existing_questions[:5], 1):
+        existing_text.append(f"{i}. {q.text[:200]}")
+    
+    new_text = []
+    for i, q in enumerate(new_questions, 0):
+        new_text.append(f"Index {i}: {q.text[:200]}")
+    
+    profile = quiz_context.profile
+    
+    user_prompt = _INSTRUCTIONS + \
+f"""
+**Quiz Quality Standards:**
+- **Style:** {profile.style}
+- **Complexity:** {profile.complexity}
+- **Language:** {profile.language}
+- **Target Audience:** {profile.target_audience}
+
+**Existing Questions (Reference Sample):**
+{chr(10).join(existing_text) if existing_text else "None provided"}
+
+**New Questions to Validate (indexed 0 to {len(new_questions)-1}):**
+{chr(10).join(new_text) if new_text else "None provided"}
+"""
     
     resp = agent._generate(
-        system_prompt,
+        _SYSTEM_PROMPT,
         user_prompt,
         temperature=0.3,
         response_format={"type": "json_object"}
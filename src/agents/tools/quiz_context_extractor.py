@@ -1,13 +1,25 @@
 """Tool for extracting context from existing quiz structure, style, and characteristics."""
 
+import hashlib
+import threading
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+
 if TYPE_CHECKING:
     from ..agent import Agent
     from ...models import Quiz
 
 from ..schemas import QuizContext
 
+# Raw LLM responses keyed by a digest of model + prompt (the prompt covers every input the result depends on)
+RESPONSE_CACHE_MAXSIZE = 256
+_response_cache: LRUCache = LRUCache(maxsize=RESPONSE_CACHE_MAXSIZE)
+_response_cache_lock = threading.Lock()
+
+_SYSTEM_PROMPT = """You are an expert educational assessment analyst specializing in quiz design, content analysis, and curriculum evaluation. Your expertise includes identifying question styles, complexity levels, language patterns, educational characteristics, and learning objectives. You analyze educational content with precision and provide comprehensive assessments that inform content generation strategies.
+"""
+
 
 def extract_quiz_context(
     quiz: "Quiz",
@@ -22,10 +34,6 @@ def extract_quiz_context(
     Returns:
         QuizContext with style, complexity, language, and other characteristics.
     """
-    system_prompt = \
-f"""You are an expert educational assessment analyst specializing in quiz design, content analysis, and curriculum evaluation. Your expertise includes identifying question styles, complexity levels, language patterns, educational characteristics, and learning objectives. You analyze educational content with precision and provide comprehensive assessments that inform content generation strategies.
-"""
-    
     # Format sample questions for analysis
     sample_questions = []
     for q in quiz.questions[:5]:  # Analyze up to 5 questions
@@ -90,21 +98,33 @@ Analyze the quiz systematically and provide the following characteristics:
 }}
 """
     
-    resp = agent._generate(
-        system_prompt,
-        user_prompt,
-        temperature=0.3,
-        response_format={"type": "json_object"}
-    )
+    # Reuse the response for an identical prompt (repeat augmentations, augment then evaluate, ...)
+    cache_key = hashlib.blake2b(f"{agent.model}\0{user_prompt}".encode("utf-8"), digest_size=16).hexdigest()
+    with _response_cache_lock:
+        resp = _response_cache.get(cache_key)
     
-    parsed = agent._parse_json(resp, {
+    if resp is None:
+        resp = agent._generate(
+            _SYSTEM_PROMPT,
+            user_prompt,
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        )
+    
+    fallback = {
         "style": "academic",
         "complexity": "intermediate",
         "language": "en",
         "domain": "general",
         "covered_concepts": [],
         "target_audience": "undergraduate"
-    })
+    }
+    parsed = agent._parse_json(resp, fallback)
+    
+    # Only cache responses that parsed, so a malformed reply is retried next time
+    if parsed is not fallback:
+        with _response_cache_lock:
+            _response_cache[cache_key] = resp
     
     return QuizContext.from_dict(parsed)
 
@@ -7,6 +7,10 @@ if TYPE_CHECKING:
 
 from ..schemas import QuizProfile, Complexity, Style, TargetAudience
 
+_SYSTEM_PROMPT = """
+You are an expert educational content analyst specializing in topic analysis, domain identification, language detection, and curriculum design. Your expertise includes extracting subject domains, detecting languages, validating educational characteristics, and refining learning profiles based on topic descriptions. You analyze educational content systematically to inform quiz generation strategies.
+"""
+
 
 def extract_quiz_profile(
     topic_description: str,
@@ -26,11 +30,6 @@ def extract_quiz_profile(
         - suggested_question_count: 0 if not mentioned, otherwise the extracted or calculated count
     """
     
-    system_prompt = \
-f"""
-You are an expert educational content analyst specializing in topic analysis, domain identification, language detection, and curriculum design. Your expertise includes extracting subject domains, detecting languages, validating educational characteristics, and refining learning profiles based on topic descriptions. You analyze educational content systematically to inform quiz generation strategies.
-"""
-    
     # Conditional initial profile
     initial_profile = f"""
 **Initial Profile:**
@@ -122,7 +121,7 @@ Analyze the topic description systematically and provide:
 """
     
     resp = agent._generate(
-        system_prompt,
+        _SYSTEM_PROMPT,
         user_prompt,
         temperature=0.3,
         response_format={"type": "json_object"}
@@ -1,12 +1,30 @@
 """Tool for generating AI-powered learning suggestions and tracking progress."""
 
-from typing import TYPE_CHECKING, List, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from cachetools import TTLCache
 
 if TYPE_CHECKING:
     from ..agent import Agent
     from ...models import Question
 
-from ..schemas import ErrorEvaluation, ErrorType, PedagogicalContext, LearningProfile, LearningSuggestion, TopicProficiency, QuizContext
+from ..schemas import ErrorEvaluation, ErrorType, PedagogicalContext, LearningProfile, LearningSuggestion, QuizContext
+
+# Reinforcement suggestions for correct answers, keyed by question, topic and quiz profile
+SUGGESTION_CACHE_MAXSIZE = 1024
+SUGGESTION_CACHE_TTL_SECONDS = 24 * 3600
+_suggestion_cache: TTLCache = TTLCache(maxsize=SUGGESTION_CACHE_MAXSIZE, ttl=SUGGESTION_CACHE_TTL_SECONDS)
+_suggestion_cache_lock = threading.Lock()
+
+# System prompts for correct (reinforcement) and incorrect (remediation) answers
+_CORRECT_SYSTEM_PROMPT = """
+You are an encouraging learning coach and academic advisor specializing in student motivation and continued learning. Your expertise includes recognizing achievement, providing positive reinforcement, and guiding students toward advanced learning opportunities.
+"""
+
+_INCORRECT_SYSTEM_PROMPT = """
+You are an expert learning advisor and educational consultant specializing in personalized learning pathways and adaptive instruction. Your expertise includes diagnosing learning gaps, recommending targeted resources, and creating individualized study plans. You provide actionable, evidence-based recommendations that address specific learning needs.
+"""
 
 
 def generate_suggestions(
@@ -35,11 +53,7 @@ def generate_suggestions(
     err_type = error_analysis.error_type
     
     # Update learning profile
-    topic_entry = next((tp for tp in learning_profile.topic_proficiencies if tp.topic == topic), None)
-    if topic_entry is None:
-        topic_entry = TopicProficiency(topic=topic)
-        learning_profile.topic_proficiencies.append(topic_entry)
-    topic_entry.error_counts[err_type] = topic_entry.error_counts.get(err_type, 0) + 1
+    learning_profile.record_answer(topic, err_type)
     
     # Style description
     style_descriptions = {
@@ -64,12 +78,23 @@ def generate_suggestions(
 - Focus on {quiz_context.profile.domain} domain when relevant
 """
 
+    # Only reinforcement for correct answers is cached: its prompt depends on the question,
+    # topic and quiz profile alone, while remediation reads the running error counts
+    cache_key = (
+        agent.model,
+        question.text,
+        topic,
+        tuple(quiz_context.profile.to_dict().values()) if quiz_context else None
+    ) if err_type == ErrorType.CORRECT else None
+    if cache_key is not None:
+        with _suggestion_cache_lock:
+            suggestions_data: Optional[List[Dict[str, Any]]] = _suggestion_cache.get(cache_key)
+        if suggestions_data is not None:
+            return _to_suggestions(suggestions_data)
+    
     # Generate suggestions
     if err_type == ErrorType.CORRECT:
-        system_prompt = \
-f"""
-You are an encouraging learning coach and academic advisor specializing in student motivation and continued learning. Your expertise includes recognizing achievement, providing positive reinforcement, and guiding students toward advanced learning opportunities.
-"""
+        system_prompt = _CORRECT_SYSTEM_PROMPT
         
         user_prompt = \
 f"""
@@ -121,14 +146,12 @@ Examples:
 }}
 """
     else:
-        struggling_topics_str = ", ".join(list(learning_profile.struggling_topics.keys())[:3]) if learning_profile.struggling_topics else "None identified"
-        mistake_count = sum(tp.get_error_count(err_type) for tp in learning_profile.topic_proficiencies)
+        struggling_topics = [topic for topic, _ in learning_profile.iter_struggling()]
+        struggling_topics_str = ", ".join(struggling_topics[:3]) or "None identified"
+        mistake_count = learning_profile.get_error_count(err_type)
         related_concepts_str = ", ".join(pedagogical_context.related_concepts[:3]) if pedagogical_context.related_concepts else "None identified"
         
-        system_prompt = \
-f"""
-You are an expert learning advisor and educational consultant specializing in personalized learning pathways and adaptive instruction. Your expertise includes diagnosing learning gaps, recommending targeted resources, and creating individualized study plans. You provide actionable, evidence-based recommendations that address specific learning needs.
-"""
+        system_prompt = _INCORRECT_SYSTEM_PROMPT
         
         user_prompt = \
 f"""
@@ -226,13 +249,21 @@ Examples:
                 )
             ]
     
-    suggestions = []
-    for item in suggestions_data[:3]:
-        suggestions.append(LearningSuggestion(
-            title=item.get("title", "Learning suggestion"),
-            explanation=item.get("explanation", ""),
-            resources=item.get("resources", [])
-        ))
+    suggestions_data = suggestions_data[:3]
+    if cache_key is not None:
+        with _suggestion_cache_lock:
+            _suggestion_cache[cache_key] = suggestions_data
     
-    return suggestions
+    return _to_suggestions(suggestions_data)
+
 
+def _to_suggestions(suggestions_data: List[Dict[str, Any]]) -> List[LearningSuggestion]:
+    """Build fresh LearningSuggestion objects (cached payloads are shared and never mutated)."""
+    return [
+        LearningSuggestion(
+            title=item.get("title", "Learning suggestion"),
+            explanation=item.get("explanation", ""),
+            resources=list(item.get("resources", []))
+        )
+        for item in suggestions_data
+    ]
@@ -8,6 +8,10 @@ if TYPE_CHECKING:
 
 from ..schemas import QuizContext, TopicCoverage, QuizProfile
 
+_SYSTEM_PROMPT = """
+You are an expert curriculum designer and educational content strategist specializing in knowledge gap analysis and comprehensive learning coverage. Your expertise includes identifying missing concepts, planning question distribution, ensuring balanced topic coverage, and recommending specific learning objectives for assessment. You analyze existing content systematically to identify opportunities for educational enhancement.
+"""
+
 
 def analyze_topic_coverage(
     quiz: "Quiz",
@@ -27,15 +31,13 @@ def analyze_topic_coverage(
         TopicCoverage with gap analysis and question generation plan.
     """
     
-    system_prompt = \
-f"""
-You are an expert curriculum designer and educational content strategist specializing in knowledge gap analysis and comprehensive learning coverage. Your expertise includes identifying missing concepts, planning question distribution, ensuring balanced topic coverage, and recommending specific learning objectives for assessment. You analyze existing content systematically to identify opportunities for educational enhancement.
-"""
-    
-    covered_concepts = ", ".join(quiz_context.covered_concepts[:10])
+    covered_concepts = ", ".join(quiz_context.covered_concepts[:10]) or "None explicitly identified"
     topic = quiz.topic
     existing_count = len(quiz.questions)
     profile = quiz_context.profile
+    complexity = profile.complexity
+    domain = profile.domain
+    target_audience = profile.target_audience
     
     user_prompt = \
 f"""
@@ -45,12 +47,12 @@ f"""
 - **Topic:** {topic}
 - **Existing Questions:** {existing_count}
 - **Target Additional Questions:** {target_count}
-- **Current Complexity Level:** {profile.complexity}
-- **Domain:** {profile.domain}
-- **Target Audience:** {profile.target_audience}
+- **Current Complexity Level:** {complexity}
+- **Domain:** {domain}
+- **Target Audience:** {target_audience}
 
 **Currently Covered Concepts:**
-{covered_concepts or "None explicitly identified"}
+{covered_concepts}
 
 **Instructions:**
 Analyze the quiz systematically to identify gaps and opportunities:
@@ -67,9 +69,9 @@ Analyze the quiz systematically to identify gaps and opportunities:
    - Recommend 3-6 specific, actionable concepts or themes for new questions
    - These should:
      * Address identified gaps
-     * Be appropriate for the complexity level ({profile.complexity})
-     * Be suitable for the target audience ({profile.target_audience})
-     * Fit within the domain ({profile.domain})
+     * Be appropriate for the complexity level ({complexity})
+     * Be suitable for the target audience ({target_audience})
+     * Fit within the domain ({domain})
    - Be specific and use domain-appropriate terminology
 
 **Guidelines:**
@@ -87,7 +89,7 @@ Analyze the quiz systematically to identify gaps and opportunities:
 """
     
     resp = agent._generate(
-        system_prompt,
+        _SYSTEM_PROMPT,
         user_prompt,
         temperature=0.5,
         response_format={"type": "json_object"}
@@ -7,6 +7,10 @@ if TYPE_CHECKING:
 
 from ..schemas import QuizContext, TopicCoverage, QuizProfile
 
+_SYSTEM_PROMPT = """
+You are an expert curriculum designer and educational content strategist specializing in knowledge planning, comprehensive topic coverage, and learning objective design. Your expertise includes identifying key concepts, planning question distribution, ensuring balanced coverage, and recommending specific learning objectives for new assessments. You analyze topics systematically to create comprehensive educational coverage plans.
+"""
+
 
 def plan_topic_coverage(
     topic_description: str,
@@ -26,11 +30,6 @@ def plan_topic_coverage(
         TopicCoverage with identified gaps and suggested concepts for question generation.
     """
     
-    system_prompt = \
-f"""
-You are an expert curriculum designer and educational content strategist specializing in knowledge planning, comprehensive topic coverage, and learning objective design. Your expertise includes identifying key concepts, planning question distribution, ensuring balanced coverage, and recommending specific learning objectives for new assessments. You analyze topics systematically to create comprehensive educational coverage plans.
-"""
-    
     profile = quiz_context.profile
     topic = topic_description.strip() or "Custom Topic"
     
@@ -92,7 +91,7 @@ Analyze the topic comprehensively and provide:
 """
     
     resp = agent._generate(
-        system_prompt,
+        _SYSTEM_PROMPT,
         user_prompt,
         temperature=0.5,
         response_format={"type": "json_object"}
@@ -1,45 +1,94 @@
 """Data models for quiz questions and topics."""
 
 from dataclasses import dataclass, field
-from typing import List
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
 import random
 import re
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Choice:
-    """Represents a single answer choice."""
+    """Represents a single answer choice (immutable, hashed by value)."""
 
     text: str
     is_correct: bool
 
-    def __hash__(self):
-        return hash((self.text, self.is_correct))
 
+_choice_text = attrgetter("text")
 
-@dataclass
+
+def join_choice_texts(choices: Iterable[Choice]) -> str:
+    """Comma-separated texts of the given choices (as shown in prompts)."""
+    return ", ".join(map(_choice_text, choices))
+
+
+@dataclass(eq=False, frozen=True, slots=True)
 class Question:
-    """Represents a single quiz question."""
+    """Represents a single quiz question.
+
+    Immutable after construction; derived fields are set once in __post_init__.
+    Questions compare and hash by identity (their fields are lists).
+    """
 
     text: str
     choices: List[Choice]
     original_choices: List[Choice] = field(default_factory=list)
+    # Derived once at construction (answers are immutable after parsing)
+    is_multiple: bool = field(init=False, repr=False)
+    # One bit per display position, keyed by choice identity so duplicate choices keep their own bit;
+    # a selection is correct iff its mask equals correct_mask
+    choice_bits: Dict[int, int] = field(init=False, repr=False)
+    correct_mask: int = field(init=False, repr=False)
+    # Joined correct choice texts, filled on first use by correct_text (prompt building only)
+    _correct_text: Optional[str] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
-        """Store original order and shuffle choices."""
+        """Store original order, shuffle choices and precompute answer metadata."""
         if not self.original_choices:
-            self.original_choices = self.choices.copy()
+            object.__setattr__(self, "original_choices", self.choices.copy())
         random.shuffle(self.choices)
+        object.__setattr__(self, "is_multiple", sum(c.is_correct for c in self.choices) > 1)
+        object.__setattr__(self, "choice_bits", {id(c): 1 << i for i, c in enumerate(self.choices)})
+        object.__setattr__(self, "correct_mask", sum(1 << i for i, c in enumerate(self.choices) if c.is_correct))
+
+    def is_correct_answer(self, selected: Iterable[Choice]) -> bool:
+        """Check whether the selected choices are exactly the correct ones."""
+        choice_bits = self.choice_bits
+        mask = 0
+        for choice in selected:
+            bit = choice_bits.get(id(choice))
+            if bit is None:
+                # An equal choice from another copy of the question (first matching position)
+                try:
+                    bit = 1 << self.choices.index(choice)
+                except ValueError:
+                    return False  # Not one of this question's choices
+            mask |= bit
+        return mask == self.correct_mask
 
     @property
     def correct_choices(self) -> List[Choice]:
         """Get all correct choices."""
         return [c for c in self.original_choices if c.is_correct]
 
+    @property
+    def correct_text(self) -> str:
+        """Comma-separated texts of the correct choices (computed once)."""
+        correct_text = self._correct_text
+        if correct_text is None:
+            correct_text = join_choice_texts(c for c in self.original_choices if c.is_correct)
+            object.__setattr__(self, "_correct_text", correct_text)
+        return correct_text
+
 
-@dataclass
+@dataclass(eq=False, frozen=True, slots=True, weakref_slot=True)
 class Quiz:
-    """Represents a quiz topic with multiple questions."""
+    """Represents a quiz topic with multiple questions.
+
+    Quizzes compare and hash by identity so they can key per-instance caches
+    (weakly referenced). Fields are frozen; the question list itself may grow.
+    """
 
     topic: str
     questions: List[Question]
@@ -51,10 +100,6 @@ class Quiz:
         """Generate URL-friendly slug from topic."""
         return re.sub(r'[^\w-]+', '-', self.topic.lower()).strip('-')
 
-    def shuffle_questions(self):
-        """Shuffle the order of questions."""
-        random.shuffle(self.questions)
-
     @property
     def total_questions(self) -> int:
         """Get total number of questions."""
@@ -1,9 +1,14 @@
 """Parser for markdown quiz files."""
 
 import re
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from .models import Quiz, Question, Choice
 
+# Precompiled patterns (searched with a start position instead of slicing the content)
+_TOPIC_PATTERN = re.compile(r'^([^:>]+?)(?::\s*(\d+))?\s*$', re.IGNORECASE)
+_OPENING_TAG_PATTERN = re.compile(r'<\s*([^>]+?)\s*>', re.IGNORECASE)
+_CLOSING_TAG_PATTERN = re.compile(r'<\s*/\s*([^>]+?)\s*>', re.IGNORECASE)
+
 
 class QuizParser:
     """Parse quizzes from markdown string."""
@@ -25,7 +30,7 @@ class QuizParser:
         # Pattern: topic name, optional colon+number, optional whitespace
         # Matches: "Topic", "Topic:5", "Topic : 5", "Topic:  5", "Topic 5" (non-timed), etc.
         # Rejects: "Topic:a" (non-numeric time), invalid formats
-        match = re.match(r'^([^:>]+?)(?::\s*(\d+))?\s*$', opening_tag_content.strip(), re.IGNORECASE)
+        match = _TOPIC_PATTERN.match(opening_tag_content.strip())
         if not match:
             return None
         
@@ -39,19 +44,18 @@ class QuizParser:
 
     @staticmethod
     def _find_opening_tag(content: str, start_pos: int) -> Optional[re.Match]:
-        """Find the next opening tag.
+        """Find the next opening tag (match positions are absolute).
         
         Args:
             content: Full markdown content to search
             start_pos: Character position to start searching from
         """
-        pattern = r'<\s*([^>]+?)\s*>'
-        return re.search(pattern, content[start_pos:], re.IGNORECASE)
+        return _OPENING_TAG_PATTERN.search(content, start_pos)
 
 
     @staticmethod
     def _find_closing_tag(content: str, start_pos: int, topic: str, is_timed: bool) -> Optional[re.Match]:
-        """Find matching closing tag
+        """Find matching closing tag (match positions are absolute)
         
         Args:
             content: Full markdown content to search
@@ -59,10 +63,9 @@ class QuizParser:
             topic: Topic name (e.g., "Topic" or "Topic 5")
             is_timed: Whether the quiz is timed
         """
-        pattern = r'<\s*/\s*([^>]+?)\s*>'
         norm_topic = topic.strip().lower()
         
-        for match in re.finditer(pattern, content[start_pos:], re.IGNORECASE):
+        for match in _CLOSING_TAG_PATTERN.finditer(content, start_pos):
             closing = match.group(1).strip()
             if not (parsed := QuizParser._parse_topic(closing)):
                 continue
@@ -99,7 +102,7 @@ class QuizParser:
         if not (opening_match := QuizParser._find_opening_tag(content, start_pos)):
             return None  # No more opening tags found, stop parsing
         
-        opening_tag_end = start_pos + opening_match.end()
+        opening_tag_end = opening_match.end()
         opening_tag_content = opening_match.group(1)
         
         # Step 2: Parse and validate the opening tag
@@ -114,11 +117,11 @@ class QuizParser:
             return (None, opening_tag_end) # No matching closing tag, continue parsing
         
         # Step 4: Extract and parse quiz content (between opening and closing tags)
-        quiz_content = content[opening_tag_end:opening_tag_end + closing_match.start()].strip()
+        quiz_content = content[opening_tag_end:closing_match.start()].strip()
         questions: List[Question] = parse_questions(quiz_content)
         
         if not questions:
-            return (None, opening_tag_end + closing_match.end()) # No questions found, skip continue parsing
+            return (None, closing_match.end()) # No questions found, skip continue parsing
         
         # Step 5: Return Quiz and position after closing tag
         quiz = Quiz(
@@ -127,7 +130,7 @@ class QuizParser:
             time_limit=minutes * 60 if minutes is not None else 0, 
             file_path=source_file
         )
-        return (quiz, opening_tag_end + closing_match.end())
+        return (quiz, closing_match.end())
 
 
     # ============================================
@@ -141,6 +144,12 @@ class QuizParser:
             return QuizParser.from_string(f.read(), source_file=file_path)
 
 
+    @staticmethod
+    def from_bytes(data: Union[bytes, bytearray], source_file: str = "") -> List[Quiz]:
+        """Parse quizzes from UTF-8 encoded markdown bytes."""
+        return QuizParser.from_string(str(data, 'utf-8'), source_file=source_file)
+
+
     @staticmethod
     def from_string(content: str, source_file: str = "") -> List[Quiz]:
         """Parse quizzes from markdown string."""
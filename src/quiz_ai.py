@@ -79,6 +79,29 @@ class QuizAI:
         )
 
 
+    async def generate_quiz_async(
+        self,
+        topic_description: str,
+        complexity: str,
+        style: str,
+        target_audience: str,
+        question_count: int = 15,
+    ) -> Quiz:
+        """Generate a new quiz, overlapping independent LLM calls (Workflow 1)."""
+
+        profile = QuizProfile(
+            complexity=Complexity(complexity),
+            style=Style(style),
+            target_audience=TargetAudience(target_audience),
+        )
+
+        return await self.generator.generate_quiz_async(
+            topic_description=topic_description,
+            profile=profile,
+            question_count=question_count,
+        )
+
+
     def generate_questions(
         self,
         topic: str,
@@ -103,6 +126,30 @@ class QuizAI:
         )
 
 
+    async def generate_questions_async(
+        self,
+        topic: str,
+        samples: List[Question],
+        count: int = 3,
+        quiz_context: Optional[QuizContext] = None
+    ) -> List[Question]:
+        """Generate new questions concurrently using AugmenterAgent (Workflow 2).
+
+        Args:
+            topic: Quiz topic.
+            samples: Sample questions to match style from.
+            count: Number of questions to generate.
+            quiz_context: Optional cached QuizContext to avoid recalculation.
+        """
+        
+        quiz = Quiz(topic=topic, questions=samples)
+        return await self.augmenter.augment_async(
+            quiz, 
+            target_count=count,
+            quiz_context=quiz_context
+        )
+
+
     def evaluate_answer(
         self,
         question: Question,
@@ -1,7 +1,14 @@
 """Quiz storage and management."""
 
+import asyncio
+import hashlib
+import os
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
 from .models import Quiz, Question
 from .parser import QuizParser
 
@@ -12,30 +19,56 @@ class QuizStorage:
     def __init__(self, storage_dir: str = "quizzes"):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
+        self._write_lock = threading.Lock()
+        # Parsed quizzes per markdown file, keyed by path and validated by (mtime_ns, size)
+        self._quiz_cache: Dict[Path, Tuple[Tuple[int, int], List[Quiz]]] = {}
+        # Bumped under _write_lock on every invalidation, so a scan that overlapped a write is not stored
+        self._cache_generation = 0
 
 
-    # Read operations
-    def get_quizzes(self) -> List[Quiz]:
-        """Get all quizzes from markdown files."""
-        return [quiz
-            for file_path in self.storage_dir.glob("*.md") 
-            for quiz in QuizParser.from_file(str(file_path))
-        ]
+    # Helpers
+    def _quiz_path(self, quiz: Quiz) -> Path:
+        """Get markdown file path for a quiz."""
+        filename = f"{quiz.topic.replace(' ', '_').lower()}.md"
+        return self.storage_dir / filename
 
+    def _sync_dir(self) -> None:
+        """Flush directory entries once per batch of renames (POSIX only)."""
+        if os.name != "posix":
+            return
+        fd = os.open(self.storage_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
-    def get_quiz(self, slug: str) -> Optional[Quiz]:
-        """Get quiz by slug."""
-        for quiz in self.get_quizzes():
-            if quiz.slug == slug:
-                return quiz
-        return None
+    def _context_path(self, slug: str) -> Path:
+        """Get cached quiz context file path for a quiz slug."""
+        return self.storage_dir / f"{slug}.context.json"
 
-    def get_quiz_content(self, slug: str) -> Optional[str]:
-        """Get raw markdown content of a quiz by slug."""
-        quiz = self.get_quiz(slug)
-        if not quiz:
-            return None
+    @staticmethod
+    def content_hash(quiz: Quiz) -> str:
+        """Hash quiz content independently of question order.
         
+        Question blocks are sorted before hashing, so reordering questions
+        (e.g. in the markdown file) does not invalidate the cached context.
+        """
+        blocks = sorted(
+            "\n".join([question.text] + [
+                f"{'>' if choice.is_correct else '-'} {choice.text}"
+                for choice in question.original_choices
+            ])
+            for question in quiz.questions
+        )
+        digest = hashlib.blake2b(f"{quiz.topic}:{quiz.time_limit}".encode("utf-8"), digest_size=16)
+        for block in blocks:
+            digest.update(b"\0")
+            digest.update(block.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _to_markdown(quiz: Quiz) -> str:
+        """Format quiz as markdown content."""
         # Format opening tag: include time limit if present
         minutes = quiz.time_limit // 60 if quiz.time_limit > 0 else None
         opening_tag = f"<{quiz.topic}:{minutes}>" if minutes else f"<{quiz.topic}>"
@@ -52,27 +85,106 @@ class QuizStorage:
         return "\n".join(lines)
 
 
+    # Read operations
+    def get_quizzes(self) -> List[Quiz]:
+        """Get all quizzes from markdown files.
+        
+        Files are re-parsed only when their mtime or size changes; unchanged files
+        return the cached Quiz instances, which callers must not mutate.
+        """
+        with self._write_lock:
+            generation = self._cache_generation
+            previous = self._quiz_cache
+        
+        # Stat and parse outside the lock; the result only replaces the cache if no write intervened
+        cache: Dict[Path, Tuple[Tuple[int, int], List[Quiz]]] = {}
+        for file_path in self.storage_dir.glob("*.md"):
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue  # Deleted since the directory scan
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = previous.get(file_path)
+            if cached is None or cached[0] != version:
+                cached = (version, QuizParser.from_file(str(file_path)))
+            cache[file_path] = cached
+        
+        with self._write_lock:
+            if self._cache_generation == generation:
+                self._quiz_cache = cache
+        return [quiz for _, quizzes in cache.values() for quiz in quizzes]
+
+
+    def get_quiz(self, slug: str) -> Optional[Quiz]:
+        """Get quiz by slug."""
+        for quiz in self.get_quizzes():
+            if quiz.slug == slug:
+                return quiz
+        return None
+
+    async def aget_quiz(self, slug: str) -> Optional[Quiz]:
+        """Get quiz by slug without blocking the event loop."""
+        return await asyncio.to_thread(self.get_quiz, slug)
+
+    def get_quiz_content(self, slug: str) -> Optional[str]:
+        """Get raw markdown content of a quiz by slug."""
+        quiz = self.get_quiz(slug)
+        if not quiz:
+            return None
+        
+        return self._to_markdown(quiz)
+
+
+    def load_quiz_context(self, slug: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Load a cached quiz context if it matches the quiz content hash.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Serialized quiz context, or None if missing or stale
+        """
+        try:
+            data = orjson.loads(self._context_path(slug).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if data.get("hash") != content_hash:
+            return None
+        return data.get("context")
+
+
     # Write operations
     def save_quiz(self, quiz: Quiz) -> str:
         """Save quiz to markdown file."""
-        filename = f"{quiz.topic.replace(' ', '_').lower()}.md"
-        file_path = self.storage_dir / filename
+        return self.save_quizzes([quiz])[0]
 
-        # Format opening tag: include time limit if present
-        minutes = quiz.time_limit // 60 if quiz.time_limit > 0 else None
-        opening_tag = f"<{quiz.topic}:{minutes}>" if minutes else f"<{quiz.topic}>"
+    def save_quizzes(self, quizzes: Iterable[Quiz]) -> List[str]:
+        """Save multiple quizzes to markdown files under a single write lock.
         
-        lines = [opening_tag, ""]
-        for question in quiz.questions:
-            lines.append(question.text)
-            for choice in question.original_choices:
-                prefix = ">" if choice.is_correct else "-"
-                lines.append(f"{prefix} {choice.text}")
-            lines.append("")
-        lines.append(f"</{quiz.topic}>")
+        Returns:
+            List[str]: Paths of the saved files
+        """
+        # Render outside the lock; only the file writes are serialized
+        rendered = [(self._quiz_path(quiz), self._to_markdown(quiz)) for quiz in quizzes]
+        with self._write_lock:
+            # Write to hidden temp files and rename, so concurrent readers never see partial content
+            for file_path, content in rendered:
+                tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+                tmp_path.write_text(content, encoding='utf-8')
+                os.replace(tmp_path, file_path)
+                self._quiz_cache.pop(file_path, None)
+            self._cache_generation += 1
+            self._sync_dir()
+        return [str(file_path) for file_path, _ in rendered]
 
-        file_path.write_text("\n".join(lines), encoding='utf-8')
-        return str(file_path)
+
+    def save_quiz_context(self, slug: str, content_hash: str, context: Dict[str, Any]) -> None:
+        """Persist a serialized quiz context, replacing any previous one atomically."""
+        file_path = self._context_path(slug)
+        tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps({"hash": content_hash, "context": context}))
+        os.replace(tmp_path, file_path)
+
+    def delete_quiz_context(self, slug: str) -> None:
+        """Remove the cached quiz context for a slug, if any."""
+        self._context_path(slug).unlink(missing_ok=True)
 
 
     def delete_quiz(self, slug: str) -> bool:
@@ -85,12 +197,15 @@ class QuizStorage:
         if not quiz:
             return False
         
-        filename = f"{quiz.topic.replace(' ', '_').lower()}.md"
-        file_path = self.storage_dir / filename
+        file_path = self._quiz_path(quiz)
         
-        if file_path.exists():
-            file_path.unlink()
-            return True
+        with self._write_lock:
+            self.delete_quiz_context(slug)
+            self._quiz_cache.pop(file_path, None)
+            self._cache_generation += 1
+            if file_path.exists():
+                file_path.unlink()
+                return True
         return False
 
     def delete_quizzes(self) -> int:
@@ -100,7 +215,12 @@ class QuizStorage:
             int: Number of files deleted
         """
         deleted_count = 0
-        for file_path in self.storage_dir.glob("*.md"):
-            file_path.unlink()
-            deleted_count += 1
+        with self._write_lock:
+            for file_path in self.storage_dir.glob("*.md"):
+                file_path.unlink()
+                deleted_count += 1
+            for file_path in self.storage_dir.glob("*.context.json"):
+                file_path.unlink()
+            self._quiz_cache = {}
+            self._cache_generation += 1
         return deleted_count